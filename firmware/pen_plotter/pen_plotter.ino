@@ -15,6 +15,11 @@
  *   GET_POS           - Get current position
  *   STATUS            - Get system status
  *   DEBUG_ADC         - Read all 4 ADC channels (debugging)
+ *
+ * ROTATE and LINEAR can also be sent as 6-byte binary frames:
+ *   <opcode> <int32 argument, little-endian> <XOR checksum of previous 5 bytes>
+ * Opcodes have the high bit set, so a frame is never mistaken for text.
+ * Responses are the same text lines (OK / ERROR: ...) as the text commands.
  */
 
 #include <TMCStepper.h>
@@ -74,6 +79,11 @@ constexpr int LINEAR_TOLERANCE = 7;             // Reduced from 10 for better ac
 constexpr int HOME_TOLERANCE = 15;              // Larger tolerance for homing to accommodate mechanical stop
 constexpr unsigned long LINEAR_TIMEOUT = 20000; // 20 second timeout (actuator is slow)
 
+// Binary command frames
+constexpr uint8_t OPCODE_ROTATE = 0x81;
+constexpr uint8_t OPCODE_LINEAR = 0x82;
+constexpr size_t BINARY_FRAME_SIZE = 6;
+
 void setup()
 {
   // Initialize pins
@@ -84,7 +94,7 @@ void setup()
   SPI.begin();
 
   // Initialize serial
-  Serial.begin(9600);
+  Serial.begin(115200);
   while (!Serial)
     ;
 
@@ -167,12 +177,55 @@ void loop()
 {
   if (Serial.available() > 0)
   {
+    if (Serial.peek() & 0x80)
+    {
+      processBinaryCommand();
+      return;
+    }
+
     String command = Serial.readStringUntil('\n');
     command.trim();
     processCommand(command);
   }
 }
 
+void processBinaryCommand()
+{
+  uint8_t frame[BINARY_FRAME_SIZE];
+  if (Serial.readBytes(frame, BINARY_FRAME_SIZE) != BINARY_FRAME_SIZE)
+  {
+    Serial.println("ERROR: Incomplete binary frame");
+    return;
+  }
+
+  uint8_t checksum = 0;
+  for (size_t i = 0; i < BINARY_FRAME_SIZE - 1; i++)
+  {
+    checksum ^= frame[i];
+  }
+  if (checksum != frame[BINARY_FRAME_SIZE - 1])
+  {
+    Serial.println("ERROR: Binary frame checksum mismatch");
+    return;
+  }
+
+  int32_t arg = (int32_t)((uint32_t)frame[1] | ((uint32_t)frame[2] << 8) |
+                          ((uint32_t)frame[3] << 16) | ((uint32_t)frame[4] << 24));
+
+  switch (frame[0])
+  {
+  case OPCODE_ROTATE:
+    cmdRotate(arg);
+    break;
+  case OPCODE_LINEAR:
+    cmdLinear(arg);
+    break;
+  default:
+    Serial.println("ERROR: Unknown binary opcode");
+    break;
+  }
+}
+
 void processCommand(String cmd)
 {
   cmd.toUpperCase();
@@ -24,13 +24,23 @@ PEN_OFFSET_MM = 160  # Distance from stepper motor rotation point to pen tip
 # ============================================================================
 
 # Serial port settings
-BAUD_RATE = 9600
+BAUD_RATE = 115200  # Must match Serial.begin() in firmware
 SERIAL_TIMEOUT = 1.0  # seconds for read timeout
+SERIAL_BUFFER_SIZE = 1 << 16  # Driver rx/tx buffer request in bytes (Windows only)
 
 # Command timeouts (seconds)
 TIMEOUT_FAST = 5.0  # For STOP, GET_POS
 TIMEOUT_SLOW = 60.0  # For HOME, LINEAR, ROTATE (slow under load)
 
+# Send ROTATE/LINEAR as 6-byte binary frames instead of text
+# (requires firmware with binary frame support, see docs/FIRMWARE.md)
+BINARY_PROTOCOL = False
+
+# Command pipelining
+# Max unacknowledged commands in flight during batched moves: 2 ROTATE/LINEAR
+# pairs keeps the firmware fed without queuing STOP behind a backlog
+COMMAND_WINDOW = 4
+
 # ============================================================================
 # Control Parameters
 # ============================================================================
@@ -53,6 +63,12 @@ HOME_RADIUS_MM = PEN_OFFSET_MM  # Home radius: distance from rotation point to p
 BOARD_WIDTH = 280  # X extent: -140 to +140mm from rotation point
 BOARD_HEIGHT = 310  # Y extent: PEN_OFFSET_MM (160) to PEN_OFFSET_MM + 310 (470mm) from rotation point
 
+# Workspace bounds (origin-relative, derived from board dimensions)
+WORKSPACE_X_MIN = -BOARD_WIDTH / 2  # -140mm
+WORKSPACE_X_MAX = BOARD_WIDTH / 2  # +140mm
+WORKSPACE_Y_MIN = PEN_OFFSET_MM  # Board starts at pen home position (160mm)
+WORKSPACE_Y_MAX = PEN_OFFSET_MM + BOARD_HEIGHT  # Maximum reach (470mm)
+
 # Physical limits
 ANGLE_MIN = -45  # Minimum rotation angle (degrees)
 ANGLE_MAX = 45  # Maximum rotation angle (degrees)
@@ -67,3 +83,13 @@ RADIUS_MARGIN = 5  # mm to leave as margin from limits
 DEFAULT_STEP_SIZE = 0.5  # mm between interpolated points for straight lines (reduced from 1.0 for smoother motion)
                          # Smaller = smoother but slower. Tunable per draw_line() call.
                          # Recommended range: 0.5-2mm for good smoothness
+CURVE_TOLERANCE_MM = 0.1  # Max deviation between a Bezier curve and its flattened polyline
+PROGRESS_CALLBACK_STRIDE = 16  # Report drawing progress every Nth interpolated point (and the last)
+
+# ============================================================================
+# GUI
+# ============================================================================
+
+LIVE_REDRAW_INTERVAL_MS = 33  # Min time between live actuator redraws (~30 FPS)
+CLICK_MIN_INTERVAL_S = 0.016  # Canvas clicks closer together than this (one frame) share a redraw
+PORT_SCAN_CACHE_S = 2.0  # Reuse the last serial port scan for this long (enumeration can be slow)
@@ -1,7 +1,15 @@
-"""Control module for pen plotter drawing operations."""
-
-from penplotter.control.primitives import draw_line
-from penplotter.control.shapes import draw_rectangle, validate_point
-from penplotter.control.curves import draw_curve, draw_smooth_path
-
-__all__ = ["draw_line", "draw_rectangle", "validate_point", "draw_curve", "draw_smooth_path"]
+"""Control module for pen plotter drawing operations."""
+
+from penplotter.control.curves import draw_curve, draw_smooth_path
+from penplotter.control.primitives import draw_line, draw_polyline
+from penplotter.control.shapes import draw_rectangle, rectangle_corners, validate_point
+
+__all__ = [
+    "draw_line",
+    "draw_polyline",
+    "draw_rectangle",
+    "rectangle_corners",
+    "validate_point",
+    "draw_curve",
+    "draw_smooth_path",
+]
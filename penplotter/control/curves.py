@@ -4,15 +4,20 @@ This module provides functions for drawing smooth curves using Bezier interpolat
 Curves are implemented as a series of interpolated straight line segments.
 """
 
-import time
-from typing import Tuple, List
+import logging
+from typing import List, Tuple
+
 import numpy as np
 
-from penplotter.hardware import Plotter
-from penplotter.path import interpolate_line
-from penplotter.path.bezier import generate_bezier_curve, calculate_curve_length
-from penplotter.kinematics import cartesian_to_hardware
 from penplotter import config
+from penplotter.control.primitives import _stream_points, draw_line
+from penplotter.hardware import Plotter
+from penplotter.path.interpolation import interpolate_path
+
+logger = logging.getLogger(__name__)
+
+# Subdivision depth limit for the curve flattener (2^16 chords at most)
+_MAX_FLATTEN_DEPTH = 16
 
 
 def draw_curve(
@@ -22,6 +27,8 @@ def draw_curve(
     control_points: List[Tuple[float, float]],
     step_size: float = None,
     progress_callback=None,
+    tolerance: float = None,
+    callback_stride: int = None,
 ) -> None:
     """Draw a cubic Bezier curve from start to end with control points.
 
@@ -30,9 +37,9 @@ def draw_curve(
     smooth curves without requiring firmware changes.
 
     Implementation:
-    - Generates Bezier curve points using parametric equation
-    - Interpolates the curve into fine line segments
-    - Sends ROTATE and LINEAR commands for each segment
+    - Flattens the curve by adaptive subdivision until within tolerance
+    - Interpolates each flat chord into step_size line segments
+    - Streams ROTATE and LINEAR commands as one pipelined batch
     - Motors move with overlapping execution for smooth motion
 
     Args:
@@ -45,6 +52,10 @@ def draw_curve(
                    Smaller values = smoother curves but slower.
                    Default: 0.5mm (from config)
         progress_callback: Optional callback function(position, progress) for live updates
+        tolerance: Maximum deviation in mm between the true curve and the
+                   flattened polyline. Default: 0.1mm (from config)
+        callback_stride: Call progress_callback every this many points (and at
+                         the last point). Default: from config
 
     Raises:
         ValueError: If control_points doesn't contain exactly 2 points
@@ -57,59 +68,137 @@ def draw_curve(
     """
     if step_size is None:
         step_size = config.DEFAULT_STEP_SIZE
+    if tolerance is None:
+        tolerance = config.CURVE_TOLERANCE_MM
 
     if len(control_points) != 2:
-        raise ValueError(f"Cubic Bezier curves require exactly 2 control points, got {len(control_points)}")
+        raise ValueError(
+            f"Cubic Bezier curves require exactly 2 control points, got {len(control_points)}"
+        )
+
+    # Flatten the curve into chords, then split each chord into step_size
+    # pieces so the polar moves between points stay close to straight
+    curve = np.array([[start, *control_points, end]], dtype=np.float64)
+    chord_points = np.vstack((curve[0, 0], _flatten_cubics(curve, tolerance)))
+
+    # The chords are within tolerance of the curve, so their total length
+    # doubles as the curve length without sampling the curve separately
+    chord_deltas = np.diff(chord_points, axis=0)
+    curve_length = np.hypot(chord_deltas[:, 0], chord_deltas[:, 1]).sum()
+
+    logger.info("  Drawing Bezier curve (length ≈ %.1fmm)", curve_length)
+    logger.info("    Start: %s", start)
+    logger.info("    Control 1: %s", control_points[0])
+    logger.info("    Control 2: %s", control_points[1])
+    logger.info("    End: %s", end)
+
+    all_points = interpolate_path(chord_points, step_size)
+
+    logger.info("  Interpolated into %d points (step_size=%smm)", len(all_points), step_size)
+
+    _stream_points(plotter, all_points, progress_callback, callback_stride)
 
-    # Calculate approximate curve length for progress reporting
-    curve_length = calculate_curve_length(start, end, control_points)
 
-    # Generate Bezier curve points
-    # Use more samples to ensure smooth curves (100 samples typically works well)
-    curve_points = generate_bezier_curve(start, end, control_points, num_samples=100)
+def _flatten_cubics(curves: np.ndarray, tolerance: float) -> np.ndarray:
+    """Flatten a chain of cubic Bezier curves into a polyline by adaptive subdivision.
 
-    print(f"  Drawing Bezier curve (length ≈ {curve_length:.1f}mm)")
-    print(f"    Start: {start}")
-    print(f"    Control 1: {control_points[0]}")
-    print(f"    Control 2: {control_points[1]}")
-    print(f"    End: {end}")
+    Each curve is split in half (de Casteljau) until both control points lie
+    within tolerance of the chord p0-p3, so flat stretches collapse into a
+    single chord while tight bends get as many chords as they need.
 
-    # Interpolate the curve into fine segments for drawing
-    all_points = []
-    for i in range(len(curve_points) - 1):
-        segment_start = curve_points[i]
-        segment_end = curve_points[i + 1]
+    Subdivision runs level by level: every unfinished piece at a given depth,
+    across all curves, is tested and split in the same vectorized pass, so
+    the cost is a few NumPy operations per level rather than a Python call
+    per piece.
 
-        # Interpolate each segment of the Bezier curve
-        segment_points = interpolate_line(segment_start, segment_end, step_size)
+    Args:
+        curves: Array of shape (K, 4, 2) of control polygons (p0, p1, p2, p3),
+                each starting where the previous one ends
+        tolerance: Maximum control point distance from the chord in mm
+
+    Returns:
+        Array of shape (N, 2) of chord end points in order, excluding the
+        first curve's p0
+    """
+    curves = np.asarray(curves, dtype=np.float64)  # (pieces, 4, 2)
+    done = np.zeros(len(curves), dtype=bool)
 
-        # Avoid duplicate points at segment boundaries
-        if i > 0:
-            segment_points = segment_points[1:]
+    for _ in range(_MAX_FLATTEN_DEPTH):
+        split = ~done
+        split[split] = ~_is_flat(curves[split], tolerance)
+        if not split.any():
+            break
 
-        all_points.extend(segment_points)
+        # Each split piece is replaced in place by its two halves, so the
+        # position of every piece shifts by the number of splits before it
+        new_index = np.arange(len(curves)) + np.concatenate(([0], np.cumsum(split)[:-1]))
+        left, right = _split_half(curves[split])
 
-    print(f"  Interpolated into {len(all_points)} points (step_size={step_size}mm)")
+        new_curves = np.empty((len(curves) + len(left), 4, 2))
+        new_done = np.empty(len(new_curves), dtype=bool)
+        new_curves[new_index[~split]] = curves[~split]
+        new_done[new_index[~split]] = True
+        new_curves[new_index[split]] = left
+        new_curves[new_index[split] + 1] = right
+        new_done[new_index[split]] = False
+        new_done[new_index[split] + 1] = False
 
-    # Draw each point with rapid sequential commands
-    for i, (x, y) in enumerate(all_points):
-        # Convert to hardware units
-        steps, adc = cartesian_to_hardware(x, y)
+        curves, done = new_curves, new_done
 
-        if i % 50 == 0 or i == len(all_points) - 1:  # Print progress every 50 points
-            print(f"    Point {i+1}/{len(all_points)}: ({x:.1f}, {y:.1f}) → steps={steps}, adc={adc}")
+    return curves[:, 3]
 
-        # Execute movements in rapid succession (overlapping execution)
-        plotter.rotate(steps)
-        plotter.linear(adc)
 
-        # Call progress callback for live position updates
-        if progress_callback:
-            progress = (i + 1) / len(all_points)
-            progress_callback((x, y), progress)
+def _is_flat(curves: np.ndarray, tolerance: float) -> np.ndarray:
+    """Test which cubic pieces have both control points within tolerance of their chord.
 
-        # No delay - send commands as fast as possible
-        # Note: If firmware can't keep up, add small delay (0.02-0.05s)
+    Args:
+        curves: Array of shape (N, 4, 2) of cubic control polygons
+        tolerance: Maximum control point distance from the chord in mm
+
+    Returns:
+        Boolean array of shape (N,)
+    """
+    p0, p1, p2, p3 = curves[:, 0], curves[:, 1], curves[:, 2], curves[:, 3]
+    chord = p3 - p0
+    chord_length = np.hypot(chord[:, 0], chord[:, 1])
+
+    # Perpendicular distance from the chord line (cross product / length)
+    cross1 = np.abs(chord[:, 0] * (p1[:, 1] - p0[:, 1]) - chord[:, 1] * (p1[:, 0] - p0[:, 0]))
+    cross2 = np.abs(chord[:, 0] * (p2[:, 1] - p0[:, 1]) - chord[:, 1] * (p2[:, 0] - p0[:, 0]))
+    limit = tolerance * chord_length
+
+    # Degenerate chord: fall back to the distance from p0
+    degenerate = chord_length == 0
+    d1 = np.hypot(p1[:, 0] - p0[:, 0], p1[:, 1] - p0[:, 1])
+    d2 = np.hypot(p2[:, 0] - p0[:, 0], p2[:, 1] - p0[:, 1])
+
+    return np.where(
+        degenerate,
+        (d1 <= tolerance) & (d2 <= tolerance),
+        (cross1 <= limit) & (cross2 <= limit),
+    )
+
+
+def _split_half(curves: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Split cubic pieces at t = 0.5 using de Casteljau's algorithm.
+
+    Args:
+        curves: Array of shape (N, 4, 2) of cubic control polygons
+
+    Returns:
+        Tuple of (left, right) halves, each of shape (N, 4, 2)
+    """
+    p0, p1, p2, p3 = curves[:, 0], curves[:, 1], curves[:, 2], curves[:, 3]
+    p01 = (p0 + p1) / 2
+    p12 = (p1 + p2) / 2
+    p23 = (p2 + p3) / 2
+    p012 = (p01 + p12) / 2
+    p123 = (p12 + p23) / 2
+    mid = (p012 + p123) / 2
+
+    left = np.stack((p0, p01, p012, mid), axis=1)
+    right = np.stack((mid, p123, p23, p3), axis=1)
+    return left, right
 
 
 def draw_smooth_path(
@@ -144,42 +233,67 @@ def draw_smooth_path(
 
     if len(points) == 2:
         # Just draw a straight line for 2 points
-        from penplotter.control.primitives import draw_line
         draw_line(plotter, points[0], points[1], step_size)
         return
 
-    print(f"  Drawing smooth path through {len(points)} waypoints")
-
-    # For each pair of consecutive points, draw a Bezier curve
-    # with automatically generated control points for smoothness
-    for i in range(len(points) - 1):
-        start = points[i]
-        end = points[i + 1]
-
-        # Generate control points based on neighboring points
-        # This creates smooth transitions between segments
-        if i == 0:
-            # First segment: control points biased toward start
-            dx, dy = end[0] - start[0], end[1] - start[1]
-            control1 = (start[0] + dx * tension * 0.33, start[1] + dy * tension * 0.33)
-            control2 = (start[0] + dx * tension * 0.66, start[1] + dy * tension * 0.66)
-        elif i == len(points) - 2:
-            # Last segment: control points biased toward end
-            dx, dy = end[0] - start[0], end[1] - start[1]
-            control1 = (start[0] + dx * (1 - tension) * 0.33, start[1] + dy * (1 - tension) * 0.33)
-            control2 = (start[0] + dx * (1 - tension) * 0.66, start[1] + dy * (1 - tension) * 0.66)
-        else:
-            # Middle segments: consider previous and next points for smoothness
-            prev = points[i - 1]
-            next_point = points[i + 2] if i + 2 < len(points) else end
-
-            # Calculate tangent direction based on neighbors
-            dx1, dy1 = start[0] - prev[0], start[1] - prev[1]
-            dx2, dy2 = next_point[0] - end[0], next_point[1] - end[1]
-
-            # Control points offset from waypoints
-            control1 = (start[0] + dx1 * tension * 0.5, start[1] + dy1 * tension * 0.5)
-            control2 = (end[0] - dx2 * tension * 0.5, end[1] - dy2 * tension * 0.5)
-
-        # Draw the curve segment
-        draw_curve(plotter, start, end, [control1, control2], step_size)
+    if step_size is None:
+        step_size = config.DEFAULT_STEP_SIZE
+
+    logger.info("  Drawing smooth path through %d waypoints", len(points))
+
+    # Plan every segment up front and stream them as one batch, so the
+    # firmware is never left idle waiting at a waypoint between curves
+    all_points = _plan_smooth_path(points, tension, step_size)
+
+    logger.info("  Interpolated into %d points (step_size=%smm)", len(all_points), step_size)
+
+    _stream_points(plotter, all_points)
+
+
+def _plan_smooth_path(
+    points: List[Tuple[float, float]],
+    tension: float,
+    step_size: float,
+    tolerance: float = None,
+) -> np.ndarray:
+    """Build the interpolated point stream for a smooth path through waypoints.
+
+    Control points for every segment are generated in one vectorized pass,
+    all curves are flattened together, and the resulting chords are
+    interpolated at step_size.
+
+    Args:
+        points: List of at least 3 waypoints [(x1, y1), (x2, y2), ...]
+        tension: Controls curve tightness (0.0 = very curved, 1.0 = nearly straight)
+        step_size: Distance between interpolated points in mm
+        tolerance: Maximum flattening error in mm (default: from config)
+
+    Returns:
+        Array of shape (N, 2) of (x, y) points along the whole path
+    """
+    if tolerance is None:
+        tolerance = config.CURVE_TOLERANCE_MM
+
+    waypoints = np.asarray(points, dtype=np.float64)
+    starts = waypoints[:-1]
+    ends = waypoints[1:]
+    deltas = ends - starts
+
+    # Middle segments: control points follow the tangents set by the
+    # neighbouring waypoints, which keeps transitions smooth
+    control1 = np.empty_like(starts)
+    control2 = np.empty_like(starts)
+    control1[1:-1] = starts[1:-1] + (starts[1:-1] - waypoints[:-3]) * tension * 0.5
+    control2[1:-1] = ends[1:-1] - (waypoints[3:] - ends[1:-1]) * tension * 0.5
+
+    # First segment: control points biased toward start
+    control1[0] = starts[0] + deltas[0] * tension * 0.33
+    control2[0] = starts[0] + deltas[0] * tension * 0.66
+
+    # Last segment: control points biased toward end
+    control1[-1] = starts[-1] + deltas[-1] * (1 - tension) * 0.33
+    control2[-1] = starts[-1] + deltas[-1] * (1 - tension) * 0.66
+
+    curves = np.stack((starts, control1, control2, ends), axis=1)
+    chord_points = np.vstack((waypoints[0], _flatten_cubics(curves, tolerance)))
+    return interpolate_path(chord_points, step_size)
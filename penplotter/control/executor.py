@@ -6,27 +6,28 @@ timing metrics, and visualization updates during drawing operations.
 """
 
 import time
-from typing import List, Tuple, Optional, Callable
 from dataclasses import dataclass
-import datetime
+from typing import Callable, List, Optional, Tuple
 
+import numpy as np
+
+from penplotter import config
+from penplotter.control.primitives import _stream_points
 from penplotter.hardware import Plotter
-from penplotter.control.primitives import draw_line
 from penplotter.path import interpolate_line
-from penplotter import config
 
 
-@dataclass
+@dataclass(frozen=True)
 class PathSegment:
-    """Represents a single segment of the drawing path."""
+    """Read-only snapshot of a single segment of the drawing path."""
 
     index: int  # Segment number in sequence
     start: Tuple[float, float]  # Start point (x, y) in mm
     end: Tuple[float, float]  # End point (x, y) in mm
     length: float  # Segment length in mm
     completed: bool = False  # Whether segment has been drawn
-    start_time: Optional[float] = None  # When execution started
-    end_time: Optional[float] = None  # When execution completed
+    start_time: Optional[float] = None  # When execution started (perf_counter seconds)
+    end_time: Optional[float] = None  # When execution completed (perf_counter seconds)
 
     @property
     def duration(self) -> Optional[float]:
@@ -45,6 +46,13 @@ class PathExecutor:
     - Timing metrics for each segment
     - Progress callbacks for live visualization
     - Simple data logging
+
+    Segment data is stored column-wise in NumPy arrays (starts, ends, lengths,
+    completion flags and timestamps) so progress metrics are single vectorized
+    reductions. PathSegment objects are built on demand as frozen snapshots,
+    so assigning to one (or to the segments tuple) raises instead of being
+    silently lost.
+    Segment timestamps are integer perf_counter_ns values (0 = not yet set).
     """
 
     def __init__(self, plotter: Plotter, step_size: float = None):
@@ -57,7 +65,8 @@ class PathExecutor:
         """
         self.plotter = plotter
         self.step_size = step_size if step_size is not None else config.DEFAULT_STEP_SIZE
-        self.segments: List[PathSegment] = []
+        self.callback_stride = config.PROGRESS_CALLBACK_STRIDE  # Points per progress callback
+        self._allocate(0)
         self.current_segment_index: int = -1
         self.progress_callback: Optional[Callable[[Optional[Tuple[float, float]], float], None]] = None
         self.execution_start_time: Optional[float] = None
@@ -70,27 +79,59 @@ class PathExecutor:
         Args:
             points: List of (x, y) coordinates defining the path
         """
-        self.segments = []
+        pts = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+        self._allocate(max(len(pts) - 1, 0))
 
-        for i in range(len(points) - 1):
-            start = points[i]
-            end = points[i + 1]
+        if len(pts) > 1:
+            self._starts[:] = pts[:-1]
+            self._ends[:] = pts[1:]
 
-            # Calculate segment length
-            dx = end[0] - start[0]
-            dy = end[1] - start[1]
-            length = (dx**2 + dy**2) ** 0.5
+            # Calculate all segment lengths in one vectorized pass
+            diffs = self._ends - self._starts
+            self._lengths[:] = np.hypot(diffs[:, 0], diffs[:, 1])
 
-            segment = PathSegment(
-                index=i,
-                start=start,
-                end=end,
-                length=length
-            )
-            self.segments.append(segment)
+            # Executed path starts at the first point and grows as segments complete
+            self._executed_points.append(tuple(pts[0].tolist()))
 
         self.current_segment_index = -1
 
+    def _allocate(self, num_segments: int):
+        """Allocate empty per-segment arrays for a path of num_segments."""
+        self._starts = np.zeros((num_segments, 2))
+        self._ends = np.zeros((num_segments, 2))
+        self._lengths = np.zeros(num_segments)
+        self._completed = np.zeros(num_segments, dtype=bool)
+        self._start_ns = np.zeros(num_segments, dtype=np.int64)
+        self._end_ns = np.zeros(num_segments, dtype=np.int64)
+        self._executed_points: List[Tuple[float, float]] = []
+
+    def __len__(self) -> int:
+        """Get number of segments in the path."""
+        return len(self._lengths)
+
+    def __getitem__(self, index: int) -> PathSegment:
+        """Get a PathSegment view of the segment at index."""
+        index = range(len(self))[index]  # Normalise negative indices, raise IndexError
+        start_ns = int(self._start_ns[index])
+        end_ns = int(self._end_ns[index])
+        return PathSegment(
+            index=index,
+            start=tuple(self._starts[index].tolist()),
+            end=tuple(self._ends[index].tolist()),
+            length=float(self._lengths[index]),
+            completed=bool(self._completed[index]),
+            start_time=start_ns / 1e9 if start_ns else None,
+            end_time=end_ns / 1e9 if end_ns else None,
+        )
+
+    @property
+    def segments(self) -> Tuple[PathSegment, ...]:
+        """Get frozen PathSegment snapshots of all segments in the path.
+
+        Use set_path() to change the path; the snapshots do not write back.
+        """
+        return tuple(self[i] for i in range(len(self)))
+
     def set_progress_callback(self, callback: Callable[[PathSegment], None]):
         """
         Set a callback function to be called after each segment completes.
@@ -106,73 +147,66 @@ class PathExecutor:
 
         This method draws all segments in sequence and tracks timing/progress.
         """
-        if not self.segments:
+        if not len(self):
             raise ValueError("No path segments defined. Call set_path() first.")
 
         self.execution_start_time = time.time()
 
-        for i, segment in enumerate(self.segments):
+        for i in range(len(self)):
             self.current_segment_index = i
-            self._execute_segment(segment)
+            self._execute_segment(i)
 
         self.execution_end_time = time.time()
 
-    def _execute_segment(self, segment: PathSegment):
+    def _execute_segment(self, index: int):
         """
         Execute a single path segment with live position tracking.
 
         Args:
-            segment: The segment to execute
+            index: Index of the segment to execute
         """
-        segment.start_time = time.time()
+        self._start_ns[index] = time.perf_counter_ns()
 
         # Get interpolated points for this segment
-        from penplotter.kinematics import cartesian_to_hardware
-        points = interpolate_line(segment.start, segment.end, self.step_size)
-
-        # Draw each point and call progress callback
-        for i, (x, y) in enumerate(points):
-            # Convert to hardware units
-            steps, adc = cartesian_to_hardware(x, y)
+        points = interpolate_line(self._starts[index], self._ends[index], self.step_size)
 
-            # Execute movements
-            self.plotter.rotate(steps)
-            self.plotter.linear(adc)
+        # Stream them as one pipelined batch, reporting the current position
+        # every callback_stride moves (and at the segment end)
+        _stream_points(self.plotter, points, self.progress_callback, self.callback_stride)
 
-            # Call progress callback with current position
-            if self.progress_callback:
-                progress = (i + 1) / len(points)
-                self.progress_callback((x, y), progress)
+        self._end_ns[index] = time.perf_counter_ns()
+        self._completed[index] = True
 
-        segment.end_time = time.time()
-        segment.completed = True
+        # Extend the executed path while segments complete in order
+        if index == len(self._executed_points) - 1:
+            self._executed_points.append(tuple(self._ends[index].tolist()))
 
     @property
     def total_segments(self) -> int:
         """Get total number of segments in the path."""
-        return len(self.segments)
+        return len(self)
 
     @property
     def completed_segments(self) -> int:
         """Get number of completed segments."""
-        return sum(1 for seg in self.segments if seg.completed)
+        return int(np.count_nonzero(self._completed))
 
     @property
     def progress_percentage(self) -> float:
         """Get execution progress as percentage (0-100)."""
-        if not self.segments:
+        if not len(self):
             return 0.0
         return (self.completed_segments / self.total_segments) * 100.0
 
     @property
     def total_path_length(self) -> float:
         """Get total length of all segments in mm."""
-        return sum(seg.length for seg in self.segments)
+        return float(self._lengths.sum())
 
     @property
     def completed_path_length(self) -> float:
         """Get length of completed segments in mm."""
-        return sum(seg.length for seg in self.segments if seg.completed)
+        return float(self._lengths[self._completed].sum())
 
     @property
     def total_execution_time(self) -> Optional[float]:
@@ -184,10 +218,11 @@ class PathExecutor:
     @property
     def average_segment_time(self) -> Optional[float]:
         """Get average time per segment in seconds."""
-        completed = [seg for seg in self.segments if seg.completed and seg.duration]
-        if not completed:
+        durations_ns = (self._end_ns - self._start_ns)[self._completed]
+        durations_ns = durations_ns[durations_ns > 0]
+        if not len(durations_ns):
             return None
-        return sum(seg.duration for seg in completed) / len(completed)
+        return float(durations_ns.mean()) / 1e9
 
     @property
     def estimated_time_remaining(self) -> Optional[float]:
@@ -206,18 +241,9 @@ class PathExecutor:
         Returns:
             List of (x, y) coordinates including all completed segments
         """
-        if not self.segments:
-            return []
-
-        points = [self.segments[0].start]  # Start with first point
-
-        for segment in self.segments:
-            if segment.completed:
-                points.append(segment.end)
-            else:
-                break
-
-        return points
+        # Maintained incrementally by _execute_segment - only the leading run
+        # of completed segments counts, since segments are drawn in order
+        return list(self._executed_points)
 
     def get_summary(self) -> dict:
         """
@@ -4,13 +4,18 @@ This module provides low-level drawing primitives that handle the conversion
 from Cartesian coordinates to hardware commands.
 """
 
-import time
-from typing import Tuple
+import logging
+from typing import List, Tuple
+
+import numpy as np
 
-from penplotter.hardware import Plotter
-from penplotter.path import interpolate_line
-from penplotter.kinematics import cartesian_to_hardware, cartesian_to_polar
 from penplotter import config
+from penplotter.hardware import Plotter
+from penplotter.kinematics import cartesian_to_moves
+from penplotter.path import interpolate_line, simplify_polyline
+from penplotter.path.interpolation import interpolate_path
+
+logger = logging.getLogger(__name__)
 
 
 def draw_line(
@@ -19,12 +24,13 @@ def draw_line(
     end: Tuple[float, float],
     step_size: float = None,
     progress_callback=None,
+    callback_stride: int = None,
 ) -> None:
     """Draw a straight line from start to end in Cartesian space.
 
     This implementation uses Scenario 5 (Hybrid Rapid Sequential):
     - Interpolates Cartesian line into fine steps (default 5mm)
-    - Sends ROTATE and LINEAR commands in rapid succession
+    - Streams ROTATE and LINEAR commands as one pipelined batch
     - Motors move with overlapping execution for smoother motion
     - No firmware changes required
 
@@ -40,6 +46,8 @@ def draw_line(
                    Smaller values = smoother lines but slower.
                    Default: 5mm (from config)
         progress_callback: Optional callback function(position, progress) for live updates
+        callback_stride: Call progress_callback every this many points (and at
+                         the last point). Default: from config
 
     Example:
         >>> with Plotter('/dev/ttyACM0') as p:
@@ -56,23 +64,95 @@ def draw_line(
     # Generate interpolated points along the line
     points = interpolate_line(start, end, step_size)
 
-    print(f"  Drawing {len(points)} points along line (step_size={step_size}mm)")
+    logger.info("  Drawing %d points along line (step_size=%smm)", len(points), step_size)
+
+    _stream_points(plotter, points, progress_callback, callback_stride)
+
+
+def draw_polyline(
+    plotter: Plotter,
+    points: List[Tuple[float, float]],
+    step_size: float = None,
+    progress_callback=None,
+    tolerance: float = None,
+    callback_stride: int = None,
+) -> None:
+    """Draw connected straight segments through a sequence of points.
+
+    Every segment is interpolated like draw_line, but the whole polyline is
+    streamed as one pipelined batch, so the plotter does not stall at each
+    vertex.
+
+    With a tolerance, the vertices are first simplified (Ramer-Douglas-Peucker)
+    so dense, nearly colinear input collapses into a few long segments. The
+    simplified segments are still interpolated at step_size, so each polar
+    move stays short enough to draw straight.
+
+    Args:
+        plotter: Connected Plotter instance
+        points: List of (x, y) vertices in mm (at least 2)
+        step_size: Distance between interpolated points in mm (default: from config)
+        progress_callback: Optional callback function(position, progress) for live updates
+        tolerance: Optional simplification tolerance in mm (default: keep every vertex)
+        callback_stride: Call progress_callback every this many points (and at
+                         the last point). Default: from config
+
+    Raises:
+        ValueError: If fewer than 2 points provided
+    """
+    if step_size is None:
+        step_size = config.DEFAULT_STEP_SIZE
+
+    if len(points) < 2:
+        raise ValueError("Need at least 2 points to draw a polyline")
+
+    if tolerance is not None:
+        simplified = simplify_polyline(points, tolerance)
+        logger.info("  Simplified polyline from %d to %d vertices", len(points), len(simplified))
+        points = simplified
+
+    all_points = interpolate_path(points, step_size)
+
+    logger.info("  Drawing %d points along polyline (step_size=%smm)", len(all_points), step_size)
+
+    _stream_points(plotter, all_points, progress_callback, callback_stride)
+
+
+def _stream_points(
+    plotter: Plotter,
+    points: np.ndarray,
+    progress_callback=None,
+    callback_stride: int = None,
+) -> None:
+    """Convert interpolated points to hardware units and stream them as one batch.
+
+    Args:
+        plotter: Connected Plotter instance
+        points: Array of shape (N, 2) of (x, y) points in mm
+        progress_callback: Optional callback function(position, progress)
+        callback_stride: Call progress_callback every this many points (and at
+                         the last point). Default: from config
+    """
+    if callback_stride is None:
+        callback_stride = config.PROGRESS_CALLBACK_STRIDE
 
-    # Draw each point with rapid sequential commands
-    for i, (x, y) in enumerate(points):
-        # Convert to hardware units
-        steps, adc = cartesian_to_hardware(x, y)
+    # Convert all points to hardware units in one vectorized pass
+    moves = cartesian_to_moves(points)
 
-        print(f"    Point {i+1}/{len(points)}: ({x:.1f}, {y:.1f}) → steps={steps}, adc={adc}")
+    # Per-point trace is only formatted when debug logging is enabled
+    if logger.isEnabledFor(logging.DEBUG):
+        for i, ((x, y), (steps, adc)) in enumerate(zip(points, moves)):
+            logger.debug("    Point %d/%d: (%.1f, %.1f) → steps=%d, adc=%d",
+                         i + 1, len(points), x, y, steps, adc)
 
-        # Execute movements in rapid succession (overlapping execution)
-        plotter.rotate(steps)
-        plotter.linear(adc)
+    # Call progress callback for live position updates as moves complete,
+    # every callback_stride moves - intermediate positions would only be
+    # coalesced away by the display anyway
+    last = len(points) - 1
 
-        # Call progress callback for live position updates
-        if progress_callback:
-            progress = (i + 1) / len(points)
-            progress_callback((x, y), progress)
+    def on_move(i):
+        if (i + 1) % callback_stride == 0 or i == last:
+            progress_callback(tuple(points[i].tolist()), (i + 1) / len(points))
 
-        # No delay - send commands as fast as possible
-        # Note: If firmware can't keep up, add small delay (0.02-0.05s)
+    # Stream all moves as one pipelined batch (no per-command round-trip)
+    plotter.move_batch(moves, on_move if progress_callback else None)
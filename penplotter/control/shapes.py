@@ -6,10 +6,17 @@ with support for rotation, positioning, and workspace validation.
 """
 
 import math
-from typing import Tuple
-from .primitives import draw_line
-from .curves import draw_curve
-from penplotter.config import BOARD_WIDTH, BOARD_HEIGHT, PEN_OFFSET_MM
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+from penplotter.config import WORKSPACE_X_MAX, WORKSPACE_X_MIN, WORKSPACE_Y_MAX, WORKSPACE_Y_MIN
+
+from .primitives import draw_line, draw_polyline
+
+# Unit rectangle corners in drawing order, scaled by the half extents
+_CORNER_TEMPLATE = np.array([[-1, -1], [1, -1], [1, 1], [-1, 1]], dtype=np.float64)
+_CORNER_TEMPLATE.flags.writeable = False
 
 
 def validate_point(x: float, y: float) -> bool:
@@ -22,7 +29,7 @@ def validate_point(x: float, y: float) -> bool:
 
     Args:
         x: X coordinate in mm (should be in range [-140, 140] from rotation point)
-        y: Y coordinate in mm (should be in range [160, 510] from rotation point)
+        y: Y coordinate in mm (should be in range [160, 470] from rotation point)
 
     Returns:
         True if point is valid, False otherwise
@@ -30,24 +37,96 @@ def validate_point(x: float, y: float) -> bool:
     Raises:
         ValueError: If point is outside workspace boundaries
     """
-    x_min = -BOARD_WIDTH / 2
-    x_max = BOARD_WIDTH / 2
-    y_min = PEN_OFFSET_MM  # Board starts at pen position (160mm from rotation point)
-    y_max = PEN_OFFSET_MM + BOARD_HEIGHT  # Board extends 350mm from pen position
+    error = _bounds_error(x, y)
+    if error:
+        raise ValueError(error)
 
-    if not (x_min <= x <= x_max):
-        raise ValueError(
+    return True
+
+
+def _bounds_error(x: float, y: float) -> Optional[str]:
+    """Describe why a point is outside the workspace, or None if it is inside."""
+    # Bounds are precomputed in config
+    if not (WORKSPACE_X_MIN <= x <= WORKSPACE_X_MAX):
+        return (
             f"X coordinate {x}mm is outside workspace bounds "
-            f"[{x_min}, {x_max}]mm"
+            f"[{WORKSPACE_X_MIN}, {WORKSPACE_X_MAX}]mm"
         )
 
-    if not (y_min <= y <= y_max):
-        raise ValueError(
+    if not (WORKSPACE_Y_MIN <= y <= WORKSPACE_Y_MAX):
+        return (
             f"Y coordinate {y}mm is outside workspace bounds "
-            f"[{y_min}, {y_max}]mm"
+            f"[{WORKSPACE_Y_MIN}, {WORKSPACE_Y_MAX}]mm"
         )
 
-    return True
+    return None
+
+
+def _find_invalid_point(points) -> Optional[int]:
+    """
+    Check many points against the workspace in one vectorized pass.
+
+    Args:
+        points: Sequence or (N, 2) array of (x, y) coordinates in mm
+
+    Returns:
+        Index of the first point outside the workspace, or None if all are inside
+    """
+    pts = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+    if len(pts) == 0:
+        return None
+
+    # Common case: the bounding box fits, which takes two reductions instead
+    # of a per-point mask (NaN fails these comparisons and falls through)
+    mins = pts.min(axis=0)
+    maxs = pts.max(axis=0)
+    if (WORKSPACE_X_MIN <= mins[0] and maxs[0] <= WORKSPACE_X_MAX
+            and WORKSPACE_Y_MIN <= mins[1] and maxs[1] <= WORKSPACE_Y_MAX):
+        return None
+
+    inside = (
+        (WORKSPACE_X_MIN <= pts[:, 0]) & (pts[:, 0] <= WORKSPACE_X_MAX)
+        & (WORKSPACE_Y_MIN <= pts[:, 1]) & (pts[:, 1] <= WORKSPACE_Y_MAX)
+    )
+    if inside.all():
+        return None
+    return int(np.argmin(inside))
+
+
+def rectangle_corners(
+    center: Tuple[float, float],
+    width: float,
+    height: float,
+    rotation: float = 0.0
+) -> List[Tuple[float, float]]:
+    """
+    Calculate the corners of a rectangle from its center, size and rotation.
+
+    The axis-aligned corners are rotated about the center with a single 2x2
+    rotation matrix product.
+
+    Args:
+        center: Rectangle center (x, y) in mm
+        width: Width in mm (along X before rotation)
+        height: Height in mm (along Y before rotation)
+        rotation: Counterclockwise rotation angle in degrees (default: 0)
+
+    Returns:
+        List of 4 (x, y) corners in order, suitable for draw_rectangle
+
+    Example:
+        corners = rectangle_corners(center=(0, 300), width=100, height=50, rotation=45)
+        draw_rectangle(plotter, corners)
+    """
+    angle = math.radians(rotation)
+    cos_r, sin_r = math.cos(angle), math.sin(angle)
+    rotation_matrix = np.array([[cos_r, -sin_r], [sin_r, cos_r]])
+
+    # Fold the half extents into the transform so the template is used as is
+    transform = rotation_matrix * (width / 2, height / 2)
+    corners = _CORNER_TEMPLATE @ transform.T
+    corners += center
+    return [tuple(corner) for corner in corners.tolist()]
 
 
 def draw_rectangle(
@@ -75,18 +154,20 @@ def draw_rectangle(
         # Draw a rotated rectangle
         corners = [(0, 200), (50, 220), (40, 270), (-10, 250)]
         draw_rectangle(plotter, corners)
+
+        # Or from center, size and rotation
+        draw_rectangle(plotter, rectangle_corners((0, 300), 100, 50, rotation=45))
     """
     if len(corners) != 4:
         raise ValueError(f"Rectangle requires exactly 4 corners, got {len(corners)}")
 
     # Validate all corners are within workspace
-    for i, (x, y) in enumerate(corners):
-        try:
-            validate_point(x, y)
-        except ValueError as e:
-            raise ValueError(f"Corner {i} ({x:.1f}, {y:.1f}mm): {e}")
+    invalid = _find_invalid_point(corners)
+    if invalid is not None:
+        x, y = corners[invalid]
+        raise ValueError(f"Corner {invalid} ({x:.1f}, {y:.1f}mm): {_bounds_error(x, y)}")
 
-    print(f"Drawing rectangle:")
+    print("Drawing rectangle:")
     print(f"  Corners: {[(f'{x:.1f}', f'{y:.1f}') for x, y in corners]}")
 
     # Draw the four sides of the rectangle
@@ -95,7 +176,7 @@ def draw_rectangle(
         end = corners[(i + 1) % 4]  # Wrap around to first corner
         draw_line(plotter, start, end, step_size, progress_callback)
 
-    print(f"Rectangle drawn successfully")
+    print("Rectangle drawn successfully")
 
 
 def draw_circle(
@@ -107,11 +188,11 @@ def draw_circle(
     progress_callback=None
 ) -> None:
     """
-    Draw a circle with the pen plotter using Bezier curve approximation.
+    Draw a circle with the pen plotter as a parametric polyline.
 
-    The circle is drawn using 4 cubic Bezier curves (one per quadrant).
-    This provides a smooth, mathematically accurate circle using the existing
-    curve infrastructure.
+    Points are generated directly on the circle with one vectorized cos/sin
+    sweep, spaced step_size apart along the arc, and streamed as a single
+    polyline. Starts and ends at the rightmost point, drawing counterclockwise.
 
     Args:
         plotter: Plotter instance to control the hardware
@@ -128,12 +209,6 @@ def draw_circle(
         # Draw a 50mm radius circle centered on the board
         draw_circle(plotter, center_x=0, center_y=335, radius=50)
     """
-    # Magic constant for circular Bezier approximation
-    # This is 4/3 * (sqrt(2) - 1), the optimal value for approximating
-    # a circle with cubic Bezier curves
-    k = 0.5522847498
-    control_offset = radius * k
-
     # Calculate the 4 cardinal points on the circle
     top = (center_x, center_y + radius)
     right = (center_x + radius, center_y)
@@ -143,69 +218,22 @@ def draw_circle(
     # Validate all cardinal points are within workspace
     cardinal_points = [top, right, bottom, left]
     point_names = ["top", "right", "bottom", "left"]
-    for name, (x, y) in zip(point_names, cardinal_points):
-        try:
-            validate_point(x, y)
-        except ValueError as e:
-            raise ValueError(f"Circle {name} point ({x:.1f}, {y:.1f}mm): {e}")
+    invalid = _find_invalid_point(cardinal_points)
+    if invalid is not None:
+        x, y = cardinal_points[invalid]
+        raise ValueError(
+            f"Circle {point_names[invalid]} point ({x:.1f}, {y:.1f}mm): {_bounds_error(x, y)}"
+        )
 
-    print(f"Drawing circle:")
+    print("Drawing circle:")
     print(f"  Center: ({center_x}, {center_y})mm")
     print(f"  Radius: {radius}mm")
 
-    # Draw circle using 4 Bezier curves (one per quadrant)
-    # Each curve connects two cardinal points with appropriate control points
-
-    # Top-right quadrant (right → top)
-    draw_curve(
-        plotter,
-        right,
-        top,
-        [
-            (center_x + radius, center_y + control_offset),
-            (center_x + control_offset, center_y + radius)
-        ],
-        step_size,
-        progress_callback
-    )
-
-    # Top-left quadrant (top → left)
-    draw_curve(
-        plotter,
-        top,
-        left,
-        [
-            (center_x - control_offset, center_y + radius),
-            (center_x - radius, center_y + control_offset)
-        ],
-        step_size,
-        progress_callback
-    )
+    # Sweep the full circle with chords no longer than step_size
+    num_segments = max(8, math.ceil(2 * math.pi * radius / step_size))
+    t = np.linspace(0, 2 * math.pi, num_segments + 1)
+    points = np.column_stack((center_x + radius * np.cos(t), center_y + radius * np.sin(t)))
 
-    # Bottom-left quadrant (left → bottom)
-    draw_curve(
-        plotter,
-        left,
-        bottom,
-        [
-            (center_x - radius, center_y - control_offset),
-            (center_x - control_offset, center_y - radius)
-        ],
-        step_size,
-        progress_callback
-    )
-
-    # Bottom-right quadrant (bottom → right)
-    draw_curve(
-        plotter,
-        bottom,
-        right,
-        [
-            (center_x + control_offset, center_y - radius),
-            (center_x + radius, center_y - control_offset)
-        ],
-        step_size,
-        progress_callback
-    )
+    draw_polyline(plotter, points, step_size, progress_callback)
 
-    print(f"Circle drawn successfully")
+    print("Circle drawn successfully")
@@ -7,9 +7,22 @@ progress, and saving simple logs for later analysis.
 
 import csv
 import json
-from pathlib import Path
-from typing import List, Tuple, Optional
+import threading
+import warnings
 from datetime import datetime
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+# Write buffer for CSV logs - large enough that a long path is written in a
+# handful of syscalls rather than one per row
+_CSV_BUFFER_SIZE = 1 << 20
+
+# Execution log write buffer, and how many segments may sit in it before an
+# explicit flush (rows are never flushed individually)
+_EXECUTION_LOG_BUFFER_SIZE = 8192
+_EXECUTION_LOG_FLUSH_ROWS = 64
 
 
 class PathLogger:
@@ -18,6 +31,10 @@ class PathLogger:
 
     Stores planned paths and execution progress to files for later
     visualization and analysis.
+
+    The execution log is kept open between segments and flushed every few
+    rows; call close() (or use the logger as a context manager) when done.
+    Segment completions may be logged from several threads.
     """
 
     def __init__(self, log_dir: Optional[Path] = None):
@@ -39,6 +56,15 @@ class PathLogger:
         self.execution_log_file = self.log_dir / "execution_log.csv"
         self.summary_file = self.log_dir / "summary.json"
 
+        # Execution log handle, opened on the first completed segment
+        self._execution_log = None
+        self._execution_writer = None
+        self._unflushed_rows = 0
+
+        # Serializes writers so the header is written once and rows from
+        # different threads never interleave
+        self._execution_lock = threading.Lock()
+
     def log_planned_path(self, points: List[Tuple[float, float]]):
         """
         Log the planned path to a CSV file.
@@ -46,12 +72,10 @@ class PathLogger:
         Args:
             points: List of (x, y) coordinates defining the path
         """
-        with open(self.planned_path_file, "w", newline="") as f:
+        with open(self.planned_path_file, "w", newline="", buffering=_CSV_BUFFER_SIZE) as f:
             writer = csv.writer(f)
             writer.writerow(["index", "x_mm", "y_mm"])
-
-            for i, (x, y) in enumerate(points):
-                writer.writerow([i, x, y])
+            writer.writerows((i, x, y) for i, (x, y) in enumerate(points))
 
     def log_segment_completion(
         self,
@@ -71,33 +95,57 @@ class PathLogger:
             duration: Segment execution time in seconds
             timestamp: Unix timestamp when segment completed
         """
+        row = [
+            segment_index,
+            start[0],
+            start[1],
+            end[0],
+            end[1],
+            duration,
+            timestamp
+        ]
+
+        with self._execution_lock:
+            if self._execution_writer is None:
+                self._open_execution_log()
+
+            self._execution_writer.writerow(row)
+
+            self._unflushed_rows += 1
+            if self._unflushed_rows >= _EXECUTION_LOG_FLUSH_ROWS:
+                self._execution_log.flush()
+                self._unflushed_rows = 0
+
+    def _open_execution_log(self):
+        """Open the execution log for appending, writing the header for a new file."""
         # Check if file exists to determine if we need to write header
         write_header = not self.execution_log_file.exists()
 
-        with open(self.execution_log_file, "a", newline="") as f:
-            writer = csv.writer(f)
-
-            if write_header:
-                writer.writerow([
-                    "segment_index",
-                    "start_x_mm",
-                    "start_y_mm",
-                    "end_x_mm",
-                    "end_y_mm",
-                    "duration_s",
-                    "timestamp"
-                ])
-
-            writer.writerow([
-                segment_index,
-                start[0],
-                start[1],
-                end[0],
-                end[1],
-                duration,
-                timestamp
+        self._execution_log = open(
+            self.execution_log_file, "a", newline="", buffering=_EXECUTION_LOG_BUFFER_SIZE
+        )
+        self._execution_writer = csv.writer(self._execution_log)
+
+        if write_header:
+            self._execution_writer.writerow([
+                "segment_index",
+                "start_x_mm",
+                "start_y_mm",
+                "end_x_mm",
+                "end_y_mm",
+                "duration_s",
+                "timestamp"
             ])
 
+    def close(self):
+        """Flush and close the execution log."""
+        with self._execution_lock:
+            if self._execution_log is not None:
+                self._execution_log.close()
+                self._execution_log = None
+                self._execution_writer = None
+                self._unflushed_rows = 0
+
     def log_summary(self, summary: dict):
         """
         Save execution summary to JSON file.
@@ -105,13 +153,21 @@ class PathLogger:
         Args:
             summary: Dictionary containing execution statistics
         """
-        with open(self.summary_file, "w") as f:
-            json.dump(summary, f, indent=2)
+        # Serialize in one go rather than streaming many small writes
+        self.summary_file.write_text(json.dumps(summary, indent=2))
 
     def get_log_directory(self) -> Path:
         """Get the log directory path."""
         return self.log_dir
 
+    def __enter__(self):
+        """Context manager entry."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit."""
+        self.close()
+
 
 def load_planned_path(csv_file: Path) -> List[Tuple[float, float]]:
     """
@@ -123,16 +179,8 @@ def load_planned_path(csv_file: Path) -> List[Tuple[float, float]]:
     Returns:
         List of (x, y) coordinate tuples
     """
-    points = []
-
-    with open(csv_file, "r") as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            x = float(row["x_mm"])
-            y = float(row["y_mm"])
-            points.append((x, y))
-
-    return points
+    xy = _read_csv_columns(csv_file, ["x_mm", "y_mm"])
+    return [tuple(point) for point in xy.tolist()]
 
 
 def load_execution_log(csv_file: Path) -> List[dict]:
@@ -145,21 +193,50 @@ def load_execution_log(csv_file: Path) -> List[dict]:
     Returns:
         List of dictionaries containing segment execution data
     """
-    segments = []
+    data = _read_csv_columns(csv_file, [
+        "segment_index",
+        "start_x_mm",
+        "start_y_mm",
+        "end_x_mm",
+        "end_y_mm",
+        "duration_s",
+        "timestamp"
+    ])
+
+    return [
+        {
+            "segment_index": int(index),
+            "start": (start_x, start_y),
+            "end": (end_x, end_y),
+            "duration": duration,
+            "timestamp": timestamp
+        }
+        for index, start_x, start_y, end_x, end_y, duration, timestamp in data.tolist()
+    ]
 
-    with open(csv_file, "r") as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            segment = {
-                "segment_index": int(row["segment_index"]),
-                "start": (float(row["start_x_mm"]), float(row["start_y_mm"])),
-                "end": (float(row["end_x_mm"]), float(row["end_y_mm"])),
-                "duration": float(row["duration_s"]),
-                "timestamp": float(row["timestamp"])
-            }
-            segments.append(segment)
 
-    return segments
+def _read_csv_columns(csv_file: Path, columns: List[str]) -> np.ndarray:
+    """
+    Parse named numeric columns of a CSV log into a float array.
+
+    The whole file is parsed by NumPy's C reader instead of building a dict
+    and calling float() per row.
+
+    Args:
+        csv_file: Path to a CSV file with a header row
+        columns: Column names to read, in the order they should be returned
+
+    Returns:
+        Array of shape (num_rows, len(columns))
+    """
+    with open(csv_file) as f:
+        header = f.readline().strip().split(",")
+        usecols = [header.index(name) for name in columns]
+
+        with warnings.catch_warnings():
+            # A header-only file is a valid empty log
+            warnings.simplefilter("ignore", UserWarning)
+            return np.loadtxt(f, delimiter=",", usecols=usecols, ndmin=2)
 
 
 def calculate_path_statistics(points: List[Tuple[float, float]]) -> dict:
@@ -184,25 +261,24 @@ def calculate_path_statistics(points: List[Tuple[float, float]]) -> dict:
             "max_y": None
         }
 
+    arr = np.asarray(points, dtype=np.float64)
+
     # Calculate segment lengths
-    segment_lengths = []
-    for i in range(len(points) - 1):
-        dx = points[i + 1][0] - points[i][0]
-        dy = points[i + 1][1] - points[i][1]
-        length = (dx**2 + dy**2) ** 0.5
-        segment_lengths.append(length)
+    deltas = np.diff(arr, axis=0)
+    segment_lengths = np.hypot(deltas[:, 0], deltas[:, 1])
+    total_length = float(segment_lengths.sum())
 
     # Find bounding box
-    x_coords = [p[0] for p in points]
-    y_coords = [p[1] for p in points]
+    min_x, min_y = arr.min(axis=0).tolist()
+    max_x, max_y = arr.max(axis=0).tolist()
 
     return {
         "num_points": len(points),
         "num_segments": len(segment_lengths),
-        "total_length_mm": sum(segment_lengths),
-        "avg_segment_length_mm": sum(segment_lengths) / len(segment_lengths) if segment_lengths else 0.0,
-        "min_x": min(x_coords),
-        "max_x": max(x_coords),
-        "min_y": min(y_coords),
-        "max_y": max(y_coords)
+        "total_length_mm": total_length,
+        "avg_segment_length_mm": total_length / len(segment_lengths),
+        "min_x": min_x,
+        "max_x": max_x,
+        "min_y": min_y,
+        "max_y": max_y
     }
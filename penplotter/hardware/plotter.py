@@ -1,11 +1,19 @@
 """Hardware communication layer for pen plotter control."""
 
-import serial
+import logging
+import queue
+import struct
+import threading
 import time
-from typing import Optional, Tuple
+from typing import Callable, Iterable, List, Optional, Tuple, Union
+
+import numpy as np
+import serial
 
 from penplotter import config
 
+logger = logging.getLogger(__name__)
+
 
 class PlotterError(Exception):
     """Exception raised for plotter hardware errors."""
@@ -13,26 +21,105 @@ class PlotterError(Exception):
     pass
 
 
+class PlotterTimeoutError(PlotterError):
+    """Exception raised when the firmware does not answer a command in time."""
+
+    pass
+
+
+# Binary frame opcodes (high bit set so the firmware can tell them from text)
+_BINARY_OPCODES = {"ROTATE": 0x81, "LINEAR": 0x82}
+
+
+def encode_binary_frame(opcode: int, arg: int) -> bytes:
+    """Pack a command into the firmware's 6-byte binary frame.
+
+    Frame layout: opcode, int32 little-endian argument, XOR checksum of the
+    preceding 5 bytes.
+
+    Args:
+        opcode: Command opcode (see _BINARY_OPCODES)
+        arg: Signed 32-bit command argument
+
+    Returns:
+        Frame bytes ready to write to the serial port
+    """
+    payload = struct.pack("<Bi", opcode, arg)
+    checksum = 0
+    for byte in payload:
+        checksum ^= byte
+    return payload + bytes((checksum,))
+
+
+def encode_moves(
+    moves: Union[np.ndarray, Iterable[Tuple[int, int]]],
+) -> Tuple[List[str], np.ndarray]:
+    """Format hardware targets as interleaved ROTATE/LINEAR command strings.
+
+    All numbers are formatted in one vectorized pass instead of one f-string
+    per command. Closely spaced points often round to the same hardware
+    target, so a ROTATE or LINEAR is only emitted when its value differs
+    from the previous move (the first move always emits both).
+
+    Args:
+        moves: (N, 2) array or sequence of (stepper_microsteps, linear_adc_value)
+
+    Returns:
+        Tuple of (commands, move_indices) where move_indices[i] is the index
+        of the move that commands[i] belongs to
+    """
+    targets = np.asarray(moves, dtype=np.int64).reshape(-1, 2)
+
+    changed = np.ones(targets.shape, dtype=bool)
+    changed[1:] = targets[1:] != targets[:-1]
+    changed = changed.ravel()
+
+    prefixes = np.tile(np.array(["ROTATE ", "LINEAR "]), len(targets))[changed]
+    commands = np.char.add(prefixes, targets.ravel()[changed].astype(str)).tolist()
+    move_indices = np.repeat(np.arange(len(targets)), 2)[changed]
+    return commands, move_indices
+
+
 class Plotter:
     """Serial communication interface for pen plotter hardware.
 
     Handles low-level communication with the firmware via serial protocol.
+
+    Connection and motion status (connected, homed, stopped...) is printed to
+    stdout. With debug on, serial traffic and port setup details are logged
+    at DEBUG on this module's logger, so they only appear once the
+    application enables that level.
     """
 
-    def __init__(self, port: str, baud_rate: int = config.BAUD_RATE, debug: bool = False):
+    def __init__(
+        self,
+        port: str,
+        baud_rate: int = config.BAUD_RATE,
+        debug: bool = False,
+        binary_protocol: bool = config.BINARY_PROTOCOL,
+    ):
         """Initialize plotter connection.
 
         Args:
             port: Serial port name (e.g., '/dev/ttyACM0' or 'COM3')
             baud_rate: Serial baud rate (default: from config)
-            debug: Enable debug output for serial communication
+            debug: Log this plotter's serial traffic at DEBUG level
+            binary_protocol: Send ROTATE/LINEAR as binary frames (default: from config)
         """
         self.port = port
         self.baud_rate = baud_rate
+        self.binary_protocol = binary_protocol
         self.serial: Optional[serial.Serial] = None
         self._connected = False
         self.debug = debug
 
+        # Background writer - commands are queued and written by a daemon
+        # thread so callers can prepare the next command (or read the previous
+        # response) while the current one is still going out over the wire
+        self._write_queue: queue.Queue[Optional[bytes]] = queue.Queue()
+        self._writer: Optional[threading.Thread] = None
+        self._write_error: Optional[Exception] = None
+
     def connect(self) -> None:
         """Open serial connection to plotter."""
         try:
@@ -42,28 +129,159 @@ class Plotter:
                 timeout=config.SERIAL_TIMEOUT,
                 write_timeout=config.SERIAL_TIMEOUT,
             )
+            self._enable_low_latency()
+            self._enlarge_buffers()
+            self._start_writer()
+
             # Wait longer for Arduino auto-reset and firmware initialization
             print("Waiting for firmware to initialize...")
             time.sleep(3)
 
             # Clear any startup messages
-            discarded_lines = 0
-            while self.serial.in_waiting:
-                line = self.serial.readline()
-                discarded_lines += 1
-                if self.debug:
-                    print(f"[DEBUG] Discarded startup: {line.decode().strip()}")
-
+            discarded_lines = self._drain_input()
             if self.debug and discarded_lines > 0:
-                print(f"[DEBUG] Cleared {discarded_lines} startup message(s)")
+                logger.debug("Cleared %d startup message(s)", discarded_lines)
 
             self._connected = True
             print(f"Connected to plotter on {self.port}")
         except serial.SerialException as e:
             raise PlotterError(f"Failed to connect to {self.port}: {e}")
 
+    def _enable_low_latency(self) -> None:
+        """Ask the USB-serial driver to deliver bytes without batching.
+
+        FTDI/CH340 style adapters hold received bytes for up to 16ms before
+        handing them to the host, which adds that latency to every OK we wait
+        for. Low latency mode (ASYNC_LOW_LATENCY) drops this to ~1ms. It is
+        only available on Linux; elsewhere the default driver settings are kept.
+        """
+        try:
+            self.serial.set_low_latency_mode(True)
+            if self.debug:
+                logger.debug("Enabled low latency mode")
+        except (AttributeError, OSError, ValueError) as e:
+            # Not supported on this platform/driver - not fatal
+            if self.debug:
+                logger.debug("Low latency mode unavailable: %s", e)
+
+    def _enlarge_buffers(self) -> None:
+        """Request larger driver buffers so batched writes don't block early.
+
+        The Windows USB-serial driver defaults to ~4KB, which a batch of
+        pipelined commands can fill while the firmware is still busy. Only the
+        Windows backend supports resizing; elsewhere this is a no-op.
+        """
+        try:
+            self.serial.set_buffer_size(
+                rx_size=config.SERIAL_BUFFER_SIZE, tx_size=config.SERIAL_BUFFER_SIZE
+            )
+            if self.debug:
+                logger.debug("Serial buffers set to %d bytes", config.SERIAL_BUFFER_SIZE)
+        except AttributeError:
+            # POSIX backends have no set_buffer_size() - kernel buffers are used
+            pass
+
+    def _start_writer(self) -> None:
+        """Start the background thread that writes queued commands."""
+        self._write_error = None
+        self._writer = threading.Thread(
+            target=self._writer_loop, name="plotter-writer", daemon=True
+        )
+        self._writer.start()
+
+    def _stop_writer(self) -> None:
+        """Stop the background writer once all queued commands are written."""
+        if self._writer and self._writer.is_alive():
+            self._write_queue.put(None)
+            self._writer.join(timeout=config.SERIAL_TIMEOUT)
+        self._writer = None
+
+    def _writer_loop(self) -> None:
+        """Write queued commands to the serial port until a None sentinel arrives.
+
+        Everything queued while the previous write was in progress goes out as
+        one write, so bursts of short commands become fewer, larger transfers.
+
+        Any exception from the port is stored rather than killing the thread,
+        so queued work is still marked done and the next _write() or flush()
+        raises it in the caller's thread.
+        """
+        while True:
+            chunks = [self._write_queue.get()]
+            while chunks[-1] is not None:
+                try:
+                    chunks.append(self._write_queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            stop = chunks[-1] is None
+            if stop:
+                chunks.pop()
+
+            try:
+                # After a failed write, drop the rest so flush() can report it
+                if chunks and self._write_error is None:
+                    self.serial.write(b"".join(chunks))
+            except Exception as e:
+                self._write_error = e
+            finally:
+                for _ in range(len(chunks) + stop):
+                    self._write_queue.task_done()
+
+            if stop:
+                return
+
+    def _write(self, *commands: str) -> None:
+        """Queue commands for the background writer without waiting for them.
+
+        Several commands are joined into a single write.
+
+        Args:
+            commands: Command strings to send (newlines are appended)
+
+        Raises:
+            PlotterError: If an earlier queued write failed
+        """
+        self._raise_write_error()
+        if self.debug:
+            for command in commands:
+                logger.debug("Sending: %s", command)
+        self._write_queue.put(b"".join(self._encode_command(command) for command in commands))
+
+    def _encode_command(self, command: str) -> bytes:
+        """Encode a command for the wire, as a binary frame when enabled and supported.
+
+        Args:
+            command: Command string (e.g. "ROTATE 1200")
+
+        Returns:
+            Bytes to write to the serial port
+        """
+        if self.binary_protocol:
+            name, _, arg = command.partition(" ")
+            opcode = _BINARY_OPCODES.get(name)
+            if opcode is not None and arg:
+                return encode_binary_frame(opcode, int(arg))
+        return f"{command}\n".encode()
+
+    def flush(self) -> None:
+        """Block until every queued command has been written to the serial port.
+
+        Raises:
+            PlotterError: If a queued write failed
+        """
+        self._write_queue.join()
+        self._raise_write_error()
+
+    def _raise_write_error(self) -> None:
+        """Raise, and clear, the error stored by a failed background write."""
+        if self._write_error is not None:
+            error, self._write_error = self._write_error, None
+            raise PlotterError(f"Serial write failed: {error}") from error
+
     def disconnect(self) -> None:
         """Close serial connection."""
+        self._stop_writer()
         if self.serial and self.serial.is_open:
             self.serial.close()
             self._connected = False
@@ -85,40 +303,236 @@ class Plotter:
         if not self._connected or not self.serial:
             raise PlotterError("Not connected to plotter")
 
-        # Clear any pending input
+        # Send command
+        self._write(command)
+        self.flush()
+
+        try:
+            return self._read_response(command, timeout)
+        except PlotterError:
+            # Don't let leftovers of a failed exchange answer the next command
+            self._drain_input()
+            raise
+
+    def _drain_input(self) -> int:
+        """Discard any unread lines from the firmware.
+
+        The protocol is strictly request/response, so stale input only exists
+        after connecting (startup banner) or after a failed command. Draining
+        is done at those points rather than before every command.
+
+        Returns:
+            Number of lines discarded
+        """
+        discarded_lines = 0
         while self.serial.in_waiting:
-            discarded = self.serial.readline().decode().strip()
-            if self.debug:
-                print(f"[DEBUG] Discarded: {discarded}")
+            self.serial.readline()
+            discarded_lines += 1
+        return discarded_lines
 
-        # Send command
-        if self.debug:
-            print(f"[DEBUG] Sending: {command}")
-        self.serial.write(f"{command}\n".encode())
-        self.serial.flush()
+    def _read_response(self, command: str, timeout: float) -> str:
+        """Wait for the terminal response to a command.
 
-        # Wait for response with timeout
-        start_time = time.time()
+        Args:
+            command: Command the response belongs to (for error messages)
+            timeout: Timeout in seconds to wait for response
+
+        Returns:
+            Response string from firmware
+
+        Raises:
+            PlotterError: If the firmware reports an error
+            PlotterTimeoutError: If no terminal response arrives in time
+        """
+        # readline() blocks in the driver until a full line arrives (or the
+        # port's read timeout expires), so responses are picked up as soon as
+        # they land instead of on the next poll interval. A timeout is detected
+        # at most one read timeout (config.SERIAL_TIMEOUT) late.
+        deadline = time.monotonic() + timeout
         response_lines = []
+        pending = b""
 
-        while time.time() - start_time < timeout:
-            if self.serial.in_waiting:
-                line = self.serial.readline().decode().strip()
-                if self.debug:
-                    print(f"[DEBUG] Received: {line}")
-                response_lines.append(line)
+        while time.monotonic() < deadline:
+            pending += self.serial.readline()
+            if not pending.endswith(b"\n"):
+                # Read timed out mid-line or with nothing received - keep waiting
+                continue
 
-                # Check for terminal responses
-                if line.startswith("OK"):
-                    return line
-                elif line.startswith("ERROR"):
-                    raise PlotterError(f"Command '{command}' failed: {line}")
+            line = pending.decode().strip()
+            pending = b""
+            if self.debug:
+                logger.debug("Received: %s", line)
+            response_lines.append(line)
 
-            time.sleep(0.01)
+            # Check for terminal responses
+            if line.startswith("OK"):
+                return line
+            elif line.startswith("ERROR"):
+                raise PlotterError(f"Command '{command}' failed: {line}")
 
         if self.debug:
-            print(f"[DEBUG] All received lines: {response_lines}")
-        raise PlotterError(f"Command '{command}' timed out after {timeout}s")
+            logger.debug("All received lines: %s", response_lines)
+        raise PlotterTimeoutError(f"Command '{command}' timed out after {timeout}s")
+
+    def _discard_responses(self, count: int, timeout: float) -> bool:
+        """Read and discard the next count terminal responses (OK or ERROR).
+
+        Args:
+            count: Number of terminal responses to discard
+            timeout: Total time in seconds to wait for them
+
+        Returns:
+            True if all of them arrived before the timeout
+        """
+        deadline = time.monotonic() + timeout
+        pending = b""
+
+        while count > 0 and time.monotonic() < deadline:
+            pending += self.serial.readline()
+            if not pending.endswith(b"\n"):
+                continue
+
+            line = pending.decode().strip()
+            pending = b""
+            if self.debug:
+                logger.debug("Discarded: %s", line)
+            if line.startswith(("OK", "ERROR")):
+                count -= 1
+
+        return count == 0
+
+    def _abort_pipeline(self, unanswered: int, timeout: float) -> None:
+        """Stop the motors and consume the responses still owed after a failed command.
+
+        Commands written after the failed one are still queued in the firmware
+        and would keep moving the pen; their late responses would also be
+        taken as the answers to the next commands. STOP is sent right away,
+        then the responses to the queued commands and to STOP are read off so
+        the next exchange starts in sync.
+
+        Args:
+            unanswered: Commands written whose terminal response hasn't been read
+            timeout: Total time in seconds to wait for the outstanding responses
+        """
+        try:
+            self._write("STOP")
+            self.flush()
+        except PlotterError as e:
+            logger.warning("Could not send STOP after a failed command: %s", e)
+            return
+
+        if not self._discard_responses(unanswered + 1, timeout):
+            logger.warning("Plotter did not acknowledge STOP after a failed command; "
+                           "the connection may be out of sync - re-home before continuing")
+        self._drain_input()
+
+    def send_commands(
+        self,
+        commands: List[str],
+        timeout: float = config.TIMEOUT_SLOW,
+        callback: Optional[Callable[[int], None]] = None,
+    ) -> List[str]:
+        """Send a sequence of commands without per-command round-trips.
+
+        Commands are written ahead of their acknowledgements, keeping up to
+        config.COMMAND_WINDOW commands in flight. The firmware always has the
+        next command buffered when it finishes the current one, instead of
+        idling while each OK travels back and the next command travels out.
+        The window is kept small so that STOP is never queued behind a long
+        backlog of moves.
+
+        Writes go through the background writer, so waiting for (and acting
+        on) one acknowledgement overlaps with transmitting the next commands.
+        Responses are matched to commands in order.
+
+        If a command fails or times out, the commands after it are already in
+        the firmware's queue. STOP is sent at once and the responses still
+        owed (including STOP's) are read off before the error is raised, so
+        the next command gets its own response. The queued commands may still
+        have moved the pen, so the position is unknown afterwards. If the
+        firmware doesn't answer within timeout, a warning is logged and the
+        connection may be out of sync - re-home before sending more commands.
+
+        Args:
+            commands: Command strings to send
+            timeout: Timeout in seconds to wait for each acknowledgement (also
+                     bounds the resync after a failure)
+            callback: Optional function called with each command index once
+                      that command is acknowledged
+
+        Returns:
+            Response string for each command
+
+        Raises:
+            PlotterError: If any command fails (the batch is stopped, see above)
+            PlotterTimeoutError: If a command isn't acknowledged within timeout
+        """
+        if not self._connected or not self.serial:
+            raise PlotterError("Not connected to plotter")
+
+        responses = []
+        sent = 0
+        while len(responses) < len(commands):
+            acknowledged = len(responses)
+
+            # Top up the in-flight window with a single write
+            window_end = min(len(commands), acknowledged + config.COMMAND_WINDOW)
+            if window_end > sent:
+                self._write(*commands[sent:window_end])
+                sent = window_end
+
+            try:
+                responses.append(self._read_response(commands[acknowledged], timeout))
+            except PlotterError as e:
+                # An ERROR answered the failed command; after a timeout its
+                # response may still arrive
+                unanswered = sent - acknowledged - (0 if isinstance(e, PlotterTimeoutError) else 1)
+                self._abort_pipeline(unanswered, timeout)
+                raise
+
+            if callback:
+                callback(acknowledged)
+
+        # Surface any write failure that did not already show up as a timeout
+        self.flush()
+        return responses
+
+    def move_batch(
+        self,
+        moves: Union[np.ndarray, Iterable[Tuple[int, int]]],
+        callback: Optional[Callable[[int], None]] = None,
+        timeout: float = config.TIMEOUT_SLOW,
+    ) -> None:
+        """Stream a sequence of ROTATE/LINEAR moves without per-command round-trips.
+
+        Moves are encoded with encode_moves (commands that would repeat the
+        previous target are not sent) and streamed with send_commands.
+
+        Args:
+            moves: (N, 2) array or sequence of (stepper_microsteps, linear_adc_value)
+            callback: Optional function called with each move index, in order,
+                      once all commands of that move are acknowledged
+            timeout: Timeout in seconds to wait for each acknowledgement
+
+        Raises:
+            PlotterError: If any command fails or times out (the batch is
+                          stopped as described in send_commands)
+        """
+        targets = np.asarray(moves, dtype=np.int64).reshape(-1, 2)
+        commands, move_indices = encode_moves(targets)
+        move_indices = move_indices.tolist()
+        reported = 0
+
+        def on_ack(index):
+            nonlocal reported
+            # Moves up to the next command's move are complete (including
+            # any that needed no commands because nothing changed)
+            done = move_indices[index + 1] if index + 1 < len(commands) else len(targets)
+            while reported < done:
+                callback(reported)
+                reported += 1
+
+        self.send_commands(commands, timeout, on_ack if callback else None)
 
     def home(self) -> None:
         """Move to home position (stepper=0, linear=fully retracted)."""
@@ -1,10 +1,12 @@
 """Kinematics and coordinate transformation layer."""
 
 from penplotter.kinematics.transforms import (
+    cartesian_to_hardware,
+    cartesian_to_hardware_batch,
+    cartesian_to_moves,
     cartesian_to_polar,
-    polar_to_hardware,
     hardware_to_polar,
-    cartesian_to_hardware,
+    polar_to_hardware,
 )
 
 __all__ = [
@@ -12,4 +14,6 @@ __all__ = [
     "polar_to_hardware",
     "hardware_to_polar",
     "cartesian_to_hardware",
+    "cartesian_to_hardware_batch",
+    "cartesian_to_moves",
 ]
@@ -1,10 +1,26 @@
 """Coordinate transformation functions for pen plotter kinematics."""
 
+import functools
 import math
-from typing import Tuple
+from typing import Optional, Tuple
+
+import numpy as np
 
 from penplotter import config
 
+# Calibration constants bound once at import, so the per-point scalar
+# conversions use fast global lookups instead of config attribute lookups
+_MICROSTEPS_PER_DEGREE = config.MICROSTEPS_PER_DEGREE
+_ADC_PER_MM = config.ADC_PER_MM
+_ADC_MIN = config.ADC_MIN
+_ADC_MAX = config.ADC_MAX
+_PEN_OFFSET_MM = config.PEN_OFFSET_MM
+
+# Conversion constants folded for the batch path: radians straight to
+# microsteps, and radius straight to ADC counts (offset and scale combined)
+_MICROSTEPS_PER_RADIAN = math.degrees(1.0) * config.MICROSTEPS_PER_DEGREE
+_ADC_AT_ORIGIN = config.ADC_MIN - config.PEN_OFFSET_MM * config.ADC_PER_MM
+
 
 def cartesian_to_polar(x: float, y: float) -> Tuple[float, float]:
     """Convert Cartesian coordinates to polar coordinates.
@@ -24,11 +40,11 @@ def cartesian_to_polar(x: float, y: float) -> Tuple[float, float]:
 
     Returns:
         Tuple of (angle_degrees, radius_mm)
-        - angle_degrees: 0° = up, positive = left, negative = right
+        - angle_degrees: 0° = up, positive = right (+X), negative = left (-X)
         - radius_mm: distance from rotation point (linear actuator extension)
     """
     # Calculate radius from rotation point to target position
-    radius_mm = math.sqrt(x**2 + y**2)
+    radius_mm = math.hypot(x, y)
 
     # Rotate coordinate system so 0° points up (+Y) instead of right (+X)
     # Positive x should give positive angle (rotate right), negative x gives negative angle (rotate left)
@@ -48,16 +64,20 @@ def polar_to_hardware(angle_deg: float, radius_mm: float) -> Tuple[int, int]:
     Returns:
         Tuple of (stepper_microsteps, linear_adc_value)
     """
-    # Convert angle to microsteps
-    microsteps = int(angle_deg * config.MICROSTEPS_PER_DEGREE)
+    # Convert angle to microsteps, rounding to nearest so negative angles are
+    # not biased toward zero the way int() truncation would
+    microsteps = round(angle_deg * _MICROSTEPS_PER_DEGREE)
 
     # Convert radius to linear actuator extension
     # The actuator extends beyond the base arm length (PEN_OFFSET_MM)
-    extension_mm = radius_mm - config.PEN_OFFSET_MM
-    adc_value = int(extension_mm * config.ADC_PER_MM + config.ADC_MIN)
+    extension_mm = radius_mm - _PEN_OFFSET_MM
+    adc_value = round(extension_mm * _ADC_PER_MM + _ADC_MIN)
 
-    # Clamp ADC value to valid range
-    adc_value = max(config.ADC_MIN, min(config.ADC_MAX, adc_value))
+    # Clamp ADC value to valid range (comparisons are cheaper than max/min calls)
+    if adc_value < _ADC_MIN:
+        adc_value = _ADC_MIN
+    elif adc_value > _ADC_MAX:
+        adc_value = _ADC_MAX
 
     return (microsteps, adc_value)
 
@@ -73,19 +93,23 @@ def hardware_to_polar(microsteps: int, adc_value: int) -> Tuple[float, float]:
         Tuple of (angle_degrees, radius_mm) where radius_mm is total distance from origin
     """
     # Convert microsteps to angle
-    angle_deg = microsteps / config.MICROSTEPS_PER_DEGREE
+    angle_deg = microsteps / _MICROSTEPS_PER_DEGREE
 
     # Convert ADC to extension, then to total radius
-    extension_mm = (adc_value - config.ADC_MIN) / config.ADC_PER_MM
-    radius_mm = extension_mm + config.PEN_OFFSET_MM
+    extension_mm = (adc_value - _ADC_MIN) / _ADC_PER_MM
+    radius_mm = extension_mm + _PEN_OFFSET_MM
 
     return (angle_deg, radius_mm)
 
 
+@functools.lru_cache(maxsize=4096)
 def cartesian_to_hardware(x: float, y: float) -> Tuple[int, int]:
     """Convert Cartesian coordinates directly to hardware units.
 
     Convenience function that combines cartesian_to_polar and polar_to_hardware.
+    Results are memoized, so waypoints that recur (shared corners, repeated
+    shapes) skip the trigonometry. Floats hash by exact value, so cached
+    results are identical to a fresh conversion.
 
     Args:
         x: X coordinate in mm
@@ -96,3 +120,69 @@ def cartesian_to_hardware(x: float, y: float) -> Tuple[int, int]:
     """
     angle_deg, radius_mm = cartesian_to_polar(x, y)
     return polar_to_hardware(angle_deg, radius_mm)
+
+
+def cartesian_to_hardware_batch(
+    xs: np.ndarray,
+    ys: np.ndarray,
+    out: Optional[Tuple[np.ndarray, np.ndarray]] = None,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Convert arrays of Cartesian coordinates to hardware units in one pass.
+
+    Vectorized equivalent of calling cartesian_to_hardware on every point.
+    The unit conversions are pre-folded into single constants, so each point
+    costs one multiply for the angle and one multiply-add for the radius;
+    results match the scalar path except, in principle, exactly at a
+    rounding boundary.
+
+    Args:
+        xs: X coordinates in mm
+        ys: Y coordinates in mm
+        out: Optional preallocated (microsteps, adc_values) integer arrays to
+             write into, e.g. the two columns of an (N, 2) moves array
+
+    Returns:
+        Tuple of (stepper_microsteps, linear_adc_values) as int64 arrays
+        (the arrays in out, when given)
+    """
+    xs = np.asarray(xs, dtype=np.float64)
+    ys = np.asarray(ys, dtype=np.float64)
+
+    if out is None:
+        out = (np.empty(xs.shape, dtype=np.int64), np.empty(xs.shape, dtype=np.int64))
+    microsteps, adc_values = out
+
+    # rint rounds half to even, matching round() in polar_to_hardware
+    angle = np.arctan2(xs, ys)
+    angle *= _MICROSTEPS_PER_RADIAN
+    np.rint(angle, out=angle)
+    np.copyto(microsteps, angle, casting="unsafe")
+
+    # sqrt(x*x + y*y) rather than np.hypot, whose overflow-safe scaling is
+    # ~3x slower and buys nothing at workspace scale
+    radius = np.sqrt(xs * xs + ys * ys)
+    radius *= _ADC_PER_MM
+    radius += _ADC_AT_ORIGIN
+    np.rint(radius, out=radius)
+    np.copyto(adc_values, radius, casting="unsafe")
+    np.clip(adc_values, _ADC_MIN, _ADC_MAX, out=adc_values)
+
+    return microsteps, adc_values
+
+
+def cartesian_to_moves(points: np.ndarray) -> np.ndarray:
+    """Convert an (N, 2) array of Cartesian points to an (N, 2) moves array.
+
+    The conversion is written straight into the columns of the result, so it
+    can be passed to Plotter.move_batch without stacking.
+
+    Args:
+        points: Array of shape (N, 2) of (x, y) points in mm
+
+    Returns:
+        int64 array of shape (N, 2) of (stepper_microsteps, linear_adc_value)
+    """
+    points = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+    moves = np.empty((len(points), 2), dtype=np.int64)
+    cartesian_to_hardware_batch(points[:, 0], points[:, 1], out=(moves[:, 0], moves[:, 1]))
+    return moves
@@ -1,5 +1,6 @@
 """Path generation and interpolation module."""
 
 from penplotter.path.interpolation import interpolate_line
+from penplotter.path.simplify import simplify_polyline
 
-__all__ = ["interpolate_line"]
+__all__ = ["interpolate_line", "simplify_polyline"]
@@ -5,8 +5,63 @@ This module provides functions for generating cubic Bezier curves,
 which are then interpolated into line segments for drawing.
 """
 
+import functools
+
 import numpy as np
 
+from penplotter.path.interpolation import as_complex
+
+# Change of basis from monomials (t³, t², t, 1) to the Bernstein weights, i.e.
+# the power-basis (Horner) coefficients of B(t) = at³ + bt² + ct + d
+_POWER_TO_BERNSTEIN = np.array([
+    [-1, 3, -3, 1],
+    [3, -6, 3, 0],
+    [-3, 3, 0, 0],
+    [1, 0, 0, 0],
+], dtype=np.float64)
+
+
+@functools.lru_cache(maxsize=32)
+def _bezier_basis(num_samples):
+    """
+    Get the cubic Bernstein basis matrix for num_samples evenly spaced t values.
+
+    The weights depend only on t, so they are computed once per sample count
+    and shared by every curve sampled at that resolution. On a cache miss
+    they come from the monomials of t times a constant 4x4 matrix, which
+    avoids the pow calls and (1-t) temporaries of the Bernstein form.
+
+    Args:
+        num_samples: Number of parameter values from 0 to 1
+
+    Returns:
+        Read-only array of shape (num_samples, 4) with columns
+        (1-t)³, 3(1-t)²t, 3(1-t)t², t³
+    """
+    monomials = np.empty((num_samples, 4))
+    monomials[:, 3] = 1.0
+    monomials[:, 2] = np.linspace(0, 1, num_samples)
+    np.multiply(monomials[:, 2], monomials[:, 2], out=monomials[:, 1])
+    np.multiply(monomials[:, 1], monomials[:, 2], out=monomials[:, 0])
+
+    basis = monomials @ _POWER_TO_BERNSTEIN
+    basis.flags.writeable = False
+    return basis
+
+
+def _sample_bezier(start, end, control_points, num_samples):
+    """
+    Sample a cubic Bezier curve as an (num_samples, 2) array.
+
+    Raises:
+        ValueError: If control_points doesn't contain exactly 2 points
+    """
+    if len(control_points) != 2:
+        raise ValueError(f"Cubic Bezier curves require exactly 2 control points, got {len(control_points)}")
+
+    control_polygon = np.array([start, control_points[0], control_points[1], end], dtype=np.float64)
+    return _bezier_basis(num_samples) @ control_polygon
+
 
 def generate_bezier_curve(start, end, control_points, num_samples=100):
     """
@@ -22,37 +77,13 @@ def generate_bezier_curve(start, end, control_points, num_samples=100):
         num_samples: Number of points to sample along the curve (default: 100)
 
     Returns:
-        List of (x, y) tuples representing points along the Bezier curve
+        Array of shape (num_samples, 2) with the (x, y) points along the curve
 
     Raises:
         ValueError: If control_points doesn't contain exactly 2 points
     """
-    if len(control_points) != 2:
-        raise ValueError(f"Cubic Bezier curves require exactly 2 control points, got {len(control_points)}")
-
-    # Extract points
-    p0 = np.array(start)
-    p1 = np.array(control_points[0])
-    p2 = np.array(control_points[1])
-    p3 = np.array(end)
-
-    # Generate parameter values from 0 to 1
-    t_values = np.linspace(0, 1, num_samples)
-
-    # Calculate Bezier curve points using the cubic Bezier formula
-    curve_points = []
-    for t in t_values:
-        # Bezier basis functions
-        b0 = (1 - t) ** 3
-        b1 = 3 * (1 - t) ** 2 * t
-        b2 = 3 * (1 - t) * t ** 2
-        b3 = t ** 3
-
-        # Calculate point on curve
-        point = b0 * p0 + b1 * p1 + b2 * p2 + b3 * p3
-        curve_points.append((point[0], point[1]))
-
-    return curve_points
+    # Weighted sum of the control polygon with the cached basis matrix
+    return _sample_bezier(start, end, control_points, num_samples)
 
 
 def calculate_curve_length(start, end, control_points, num_samples=100):
@@ -70,15 +101,8 @@ def calculate_curve_length(start, end, control_points, num_samples=100):
     Returns:
         Approximate length of the curve in mm
     """
-    points = generate_bezier_curve(start, end, control_points, num_samples)
-
-    total_length = 0.0
-    for i in range(len(points) - 1):
-        p1 = np.array(points[i])
-        p2 = np.array(points[i + 1])
-        total_length += np.linalg.norm(p2 - p1)
-
-    return total_length
+    points = as_complex(_sample_bezier(start, end, control_points, num_samples))
+    return float(np.abs(np.diff(points)).sum())
 
 
 def validate_bezier_workspace(start, end, control_points, workspace_bounds):
@@ -101,10 +125,12 @@ def validate_bezier_workspace(start, end, control_points, workspace_bounds):
     max_x, max_y = workspace_bounds
     curve_points = generate_bezier_curve(start, end, control_points, num_samples=50)
 
-    out_of_bounds = []
-    for x, y in curve_points:
-        if x < 0 or x > max_x or y < 0 or y > max_y:
-            out_of_bounds.append((x, y))
+    x, y = curve_points[:, 0], curve_points[:, 1]
+    outside = (x < 0) | (x > max_x) | (y < 0) | (y > max_y)
+
+    # Common case: nothing to report, so skip building the list
+    if not outside.any():
+        return True, []
 
-    is_valid = len(out_of_bounds) == 0
-    return is_valid, out_of_bounds
+    out_of_bounds = [tuple(point) for point in curve_points[outside].tolist()]
+    return False, out_of_bounds
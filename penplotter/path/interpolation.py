@@ -1,14 +1,37 @@
 """Line interpolation for generating smooth paths in Cartesian space."""
 
 import math
-from typing import List, Tuple
+from typing import Sequence, Tuple, Union
+
+import numpy as np
+
+
+def as_complex(points: Union[np.ndarray, Sequence[Tuple[float, float]]]) -> np.ndarray:
+    """View (N, 2) x/y points as N complex numbers x + iy without copying.
+
+    Differences, scaling and abs() (the hypot) then run on one contiguous
+    array instead of two strided columns. Use as_points() to convert back.
+
+    Args:
+        points: (N, 2) array or sequence of (x, y) points
+
+    Returns:
+        Complex array of shape (N,)
+    """
+    points = np.ascontiguousarray(points, dtype=np.float64).reshape(-1, 2)
+    return points.view(np.complex128)[:, 0]
+
+
+def as_points(values: np.ndarray) -> np.ndarray:
+    """View complex points as an (N, 2) array of (x, y) without copying."""
+    return np.ascontiguousarray(values, dtype=np.complex128).view(np.float64).reshape(-1, 2)
 
 
 def interpolate_line(
     start: Tuple[float, float],
     end: Tuple[float, float],
     step_size: float = 5.0,
-) -> List[Tuple[float, float]]:
+) -> np.ndarray:
     """Interpolate points along a straight line in Cartesian space.
 
     Generates intermediate points along the line from start to end,
@@ -21,67 +44,67 @@ def interpolate_line(
         step_size: Maximum distance between interpolated points in mm
 
     Returns:
-        List of (x, y) points including start and end.
+        Array of shape (N, 2) of (x, y) points including start and end.
         If start and end are very close, returns [start, end].
     """
-    x1, y1 = start
-    x2, y2 = end
+    start = np.asarray(start, dtype=np.float64)
+    end = np.asarray(end, dtype=np.float64)
+    delta = end - start
 
-    # Calculate line length
-    dx = x2 - x1
-    dy = y2 - y1
-    length = math.sqrt(dx * dx + dy * dy)
+    # Calculate line length (scalar math - no ufunc dispatch for one value)
+    length = math.hypot(delta[0], delta[1])
 
     # If line is very short, just return start and end
     if length < step_size:
-        return [start, end]
+        return np.stack((start, end))
 
     # Calculate number of segments
-    num_segments = int(math.ceil(length / step_size))
-    num_points = num_segments + 1
-
-    # Generate interpolated points
-    points = []
-    for i in range(num_points):
-        t = i / num_segments  # Parameter from 0 to 1
-        x = x1 + t * dx
-        y = y1 + t * dy
-        points.append((x, y))
+    num_segments = math.ceil(length / step_size)
 
-    return points
+    # Generate interpolated points (t from 0 to 1)
+    t = np.linspace(0.0, 1.0, num_segments + 1)[:, np.newaxis]
+    return start + t * delta
 
 
 def interpolate_path(
-    points: List[Tuple[float, float]],
+    points: Union[np.ndarray, Sequence[Tuple[float, float]]],
     step_size: float = 5.0,
-) -> List[Tuple[float, float]]:
+) -> np.ndarray:
     """Interpolate all segments in a multi-point path.
 
     Takes a path defined by key points and adds intermediate points
     along each segment to approximate straight lines in Cartesian space.
+    All segments are interpolated in one vectorized pass on complex points.
 
     Args:
-        points: List of (x, y) waypoints defining the path
+        points: (N, 2) array or list of (x, y) waypoints defining the path
         step_size: Maximum distance between interpolated points in mm
 
     Returns:
-        List of (x, y) points with interpolation applied to all segments.
-        The first point is always included. Subsequent segment endpoints
-        are included only once (not duplicated at segment boundaries).
+        Array of shape (M, 2) of (x, y) points with interpolation applied to
+        all segments. The first point is always included. Subsequent segment
+        endpoints are included only once (not duplicated at segment boundaries).
     """
+    points = as_complex(points)
     if len(points) < 2:
-        return points
+        return as_points(points)
+
+    starts = points[:-1]
+    deltas = np.diff(points)
+    lengths = np.abs(deltas)
 
-    interpolated = []
+    # Segments shorter than one step are drawn as a single move
+    num_segments = np.where(lengths < step_size, 1, np.ceil(lengths / step_size)).astype(np.int64)
 
-    for i in range(len(points) - 1):
-        segment = interpolate_line(points[i], points[i + 1], step_size)
+    # Point k of segment s sits at t = k / num_segments[s], for k < num_segments[s]
+    segment = np.repeat(np.arange(len(starts)), num_segments)
+    offsets = np.cumsum(num_segments) - num_segments
+    t = (np.arange(len(segment)) - offsets[segment]) / num_segments[segment]
 
-        if i == 0:
-            # First segment: include all points
-            interpolated.extend(segment)
-        else:
-            # Subsequent segments: skip first point (already added as last point of previous segment)
-            interpolated.extend(segment[1:])
+    interpolated = np.empty(len(segment) + 1, dtype=np.complex128)
+    np.multiply(t, deltas[segment], out=interpolated[:-1])
+    interpolated[:-1] += starts[segment]
 
-    return interpolated
+    # Close the path with the final waypoint
+    interpolated[-1] = points[-1]
+    return as_points(interpolated)
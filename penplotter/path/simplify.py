@@ -0,0 +1,67 @@
+"""Polyline simplification for reducing the number of drawn vertices."""
+
+import math
+from typing import Sequence, Tuple, Union
+
+import numpy as np
+
+
+def simplify_polyline(
+    points: Union[np.ndarray, Sequence[Tuple[float, float]]],
+    tolerance: float = 0.2,
+) -> np.ndarray:
+    """Simplify a polyline with the Ramer-Douglas-Peucker algorithm.
+
+    Vertices that lie within tolerance of the simplified path are dropped,
+    so runs of colinear or nearly colinear points collapse into a single
+    segment. Distances are measured to the segment, not the infinite line
+    through it, so a path that doubles back on itself keeps its turning
+    point. The first and last points are always kept.
+
+    Runs iteratively with an explicit stack (no recursion limit), and the
+    distances for each span are computed in one vectorized pass.
+
+    Args:
+        points: (N, 2) array or list of (x, y) vertices in mm
+        tolerance: Maximum distance in mm between a dropped vertex and the
+                   simplified path
+
+    Returns:
+        Array of shape (M, 2) of the kept vertices, in order (M <= N)
+    """
+    pts = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+    if len(pts) < 3:
+        return pts.copy()
+
+    keep = np.zeros(len(pts), dtype=bool)
+    keep[0] = keep[-1] = True
+
+    stack = [(0, len(pts) - 1)]
+    while stack:
+        first, last = stack.pop()
+        if last - first < 2:
+            continue
+
+        start = pts[first]
+        chord = pts[last] - start
+        offsets = pts[first + 1:last] - start
+        chord_length = math.hypot(chord[0], chord[1])
+
+        if chord_length == 0:
+            # Closed span: distance from the shared end point
+            distances = np.hypot(offsets[:, 0], offsets[:, 1])
+        else:
+            # Distance to the nearest point on the chord segment: project onto
+            # the chord and clamp, so points beyond either end measure to it
+            t = np.clip(offsets @ chord / (chord_length * chord_length), 0.0, 1.0)
+            nearest = offsets - t[:, None] * chord
+            distances = np.hypot(nearest[:, 0], nearest[:, 1])
+
+        farthest = int(np.argmax(distances))
+        if distances[farthest] > tolerance:
+            split = first + 1 + farthest
+            keep[split] = True
+            stack.append((split, last))
+            stack.append((first, split))
+
+    return pts[keep]
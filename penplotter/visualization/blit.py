@@ -0,0 +1,149 @@
+"""
+Blitting helper for fast matplotlib animation.
+
+Redraws only a handful of animated artists over a cached figure background,
+instead of re-rendering the whole figure on every update. Modeled on the
+BlitManager from the matplotlib blitting tutorial.
+"""
+
+from typing import Iterable
+
+from matplotlib.artist import Artist
+
+
+class BlitManager:
+    """
+    Keep a cached background and redraw animated artists on top of it.
+
+    The background is (re)captured on every ``draw_event``, so resizing,
+    zooming or a full ``draw_idle()`` of the static content keeps it current.
+
+    Background artists are animated too (changing their data doesn't trigger
+    a full redraw), but are drawn into the background when it is captured
+    rather than on every update.
+    """
+
+    def __init__(self, canvas, animated_artists: Iterable[Artist] = (),
+                 background_artists: Iterable[Artist] = ()):
+        """
+        Args:
+            canvas: FigureCanvas to blit onto
+            animated_artists: Artists to redraw on every update
+            background_artists: Artists drawn into the captured background
+        """
+        self.canvas = canvas
+        self._background = None
+        self._background_bounds = None  # Figure bbox bounds at capture time
+        self._artists = []
+        self._background_artists = []
+
+        for artist in animated_artists:
+            self.add_artist(artist)
+        for artist in background_artists:
+            self.add_artist(artist, background=True)
+
+        self._draw_cid = canvas.mpl_connect('draw_event', self._on_draw)
+
+    def add_artist(self, artist: Artist, background: bool = False):
+        """
+        Register an artist to be redrawn on every update.
+
+        On backends that can blit, the artist is marked animated so regular
+        figure draws skip it.
+
+        Args:
+            artist: Artist belonging to this canvas's figure
+            background: If True, draw the artist into the background when it
+                is captured instead of on every update
+        """
+        if artist.figure is not self.canvas.figure:
+            raise ValueError("Artist does not belong to this canvas's figure")
+        if self.supports_blit:
+            artist.set_animated(True)
+        if background:
+            self._background_artists.append(artist)
+        else:
+            self._artists.append(artist)
+
+    @property
+    def supports_blit(self) -> bool:
+        """Whether the canvas backend supports blitting."""
+        return getattr(self.canvas, 'supports_blit', False)
+
+    def _on_draw(self, event):
+        """Capture the background after a full draw and paint the artists."""
+        canvas = self.canvas
+        if not self.supports_blit:
+            return
+        if event is not None and event.canvas is not canvas:
+            return
+        for artist in self._background_artists:
+            canvas.figure.draw_artist(artist)
+        # Figure bbox (not axes bbox) so labels and legend are included
+        self._background = canvas.copy_from_bbox(canvas.figure.bbox)
+        self._background_bounds = canvas.figure.bbox.bounds
+        self._draw_animated()
+
+    def bake(self, artists: Iterable[Artist]) -> bool:
+        """
+        Draw artists permanently into the cached background.
+
+        For content that only grows (such as a path being drawn), each new
+        piece is drawn once here instead of on every update. Register the
+        artists as background artists so regular figure draws skip them.
+
+        Args:
+            artists: Artists to draw into the background
+
+        Returns:
+            True if drawn, False if there is no usable background (backend
+            can't blit, no draw yet, or the figure was resized)
+        """
+        canvas = self.canvas
+        if (not self.supports_blit or self._background is None
+                or self._background_bounds != canvas.figure.bbox.bounds):
+            return False
+
+        canvas.restore_region(self._background)
+        for artist in artists:
+            canvas.figure.draw_artist(artist)
+        self._background = canvas.copy_from_bbox(canvas.figure.bbox)
+        return True
+
+    def disconnect(self):
+        """Stop tracking the canvas and drop the background and artists."""
+        self.canvas.mpl_disconnect(self._draw_cid)
+        self._background = None
+        self._artists.clear()
+        self._background_artists.clear()
+
+    def invalidate(self):
+        """Discard the cached background; the next update does a full redraw."""
+        self._background = None
+
+    def _draw_animated(self):
+        """Draw all animated artists onto the canvas."""
+        figure = self.canvas.figure
+        for artist in self._artists:
+            figure.draw_artist(artist)
+
+    def update(self):
+        """Redraw the animated artists on screen."""
+        canvas = self.canvas
+
+        if not self.supports_blit:
+            # Backend can't blit - fall back to a full redraw
+            canvas.draw_idle()
+            return
+
+        if self._background is None or self._background_bounds != canvas.figure.bbox.bounds:
+            # No draw yet, or the figure was resized since the background was
+            # captured; the next full draw (re)captures it
+            self._background = None
+            canvas.draw_idle()
+            return
+
+        canvas.restore_region(self._background)
+        self._draw_animated()
+        canvas.blit(canvas.figure.bbox)
+        canvas.flush_events()
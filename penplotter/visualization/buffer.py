@@ -0,0 +1,45 @@
+"""
+Growable point buffer for incrementally extended line data.
+"""
+
+import numpy as np
+
+
+class PointBuffer:
+    """
+    Growable (N, 2) vertex buffer for line data that is extended block by block.
+
+    Capacity doubles when full, so appending points doesn't copy the whole
+    path, and popping a block is just a length change.
+    """
+
+    def __init__(self, capacity: int = 128):
+        self._data = np.empty((capacity, 2))
+        self._ends = []  # End offset of each appended block
+
+    def __len__(self) -> int:
+        return self._ends[-1] if self._ends else 0
+
+    def append(self, points: np.ndarray):
+        """Append a block of (M, 2) points."""
+        start = len(self)
+        end = start + len(points)
+        if end > len(self._data):
+            grown = np.empty((max(end, 2 * len(self._data)), 2))
+            grown[:start] = self._data[:start]
+            self._data = grown
+        self._data[start:end] = points
+        self._ends.append(end)
+
+    def pop(self):
+        """Remove the most recently appended block."""
+        self._ends.pop()
+
+    def clear(self):
+        """Remove all points (capacity is kept)."""
+        self._ends.clear()
+
+    @property
+    def points(self) -> np.ndarray:
+        """View of the stored points, shape (N, 2)."""
+        return self._data[:len(self)]
@@ -6,40 +6,48 @@ replacing the previous Tkinter-based GUI with a matplotlib-based approach
 that matches the wagon project's design patterns.
 """
 
-import matplotlib.pyplot as plt
-from matplotlib.widgets import Button, TextBox, RadioButtons, Slider
-from matplotlib.backend_bases import MouseButton
-from matplotlib.patches import Circle
-import numpy as np
-from typing import List, Tuple, Optional
+import logging
+import queue
+import re
 import threading
 import time
-import serial.tools.list_ports
+import traceback
+from collections import Counter
+from contextlib import contextmanager
+from typing import List, Optional
 
-from penplotter.hardware import Plotter
-from penplotter.control import validate_point
+import numpy as np
+
+from penplotter.config import (
+    CLICK_MIN_INTERVAL_S,
+    LIVE_REDRAW_INTERVAL_MS,
+    PEN_OFFSET_MM,
+    PHYSICAL_RANGE_MM,
+    PORT_SCAN_CACHE_S,
+    WORKSPACE_X_MAX,
+    WORKSPACE_X_MIN,
+    WORKSPACE_Y_MAX,
+    WORKSPACE_Y_MIN,
+)
 from penplotter.control.executor import PathExecutor
+from penplotter.data.path import calculate_path_statistics
+from penplotter.hardware import Plotter
+from penplotter.kinematics import polar_to_hardware
+from penplotter.visualization.blit import BlitManager
+from penplotter.visualization.buffer import PointBuffer
 from penplotter.visualization.styles import (
-    MONUMENTAL_ORANGE,
     MONUMENTAL_BLUE,
     MONUMENTAL_CREAM,
-    MONUMENTAL_YELLOW_ORANGE,
     MONUMENTAL_DARK_BLUE,
+    MONUMENTAL_ORANGE,
     MONUMENTAL_TAUPE,
+    MONUMENTAL_YELLOW_ORANGE,
     apply_dark_style,
-    style_legend
-)
-from penplotter.data.path import calculate_path_statistics
-from penplotter.config import (
-    BOARD_WIDTH,
-    BOARD_HEIGHT,
-    PEN_OFFSET_MM,
-    ADC_PER_MM,
-    ADC_MIN,
-    MICROSTEPS_PER_DEGREE,
-    PHYSICAL_RANGE_MM
 )
 
+# USB serial device names: /dev/ttyUSB*, /dev/ttyACM*, /dev/cu.usbmodem*, /dev/tty.usbserial*
+_USB_PORT_RE = re.compile(r'usb|acm', re.IGNORECASE)
+
 
 class PlotterGUI:
     """
@@ -61,6 +69,21 @@ class PlotterGUI:
         self.is_drawing = False
         self.serial_port = "/dev/tty.usbmodem1101"  # Default port
         self.available_ports = []
+        self._port_scan_time = None  # time.monotonic() of the last port scan
+        self._port_scan_running = False
+
+        # Reused line data for the actuator arm (origin -> pen) and pen marker
+        self._arm_x = np.zeros(2)
+        self._arm_y = np.zeros(2)
+        self._pen_x = np.zeros(1)
+        self._pen_y = np.zeros(1)
+
+        # Redraw batching for handlers that change several things at once
+        self._batching_redraws = False
+        self._redraw_pending = False
+        self._full_redraw_pending = False
+        self._redraw_skipped = False  # A redraw was dropped while minimized
+        self._last_click_time = 0.0  # time.monotonic() of the last click redrawn immediately
         self.current_pen_position = (0, PEN_OFFSET_MM)  # Track current pen position
 
         # Drawing mode: 'Line', 'Curve', 'Rectangle', or 'Circle'
@@ -69,6 +92,18 @@ class PlotterGUI:
         # Unified segment list (supports mixed line and curve segments)
         self.segments = []  # List of segment dicts with 'type' field
 
+        # Display geometry cached per segment (see _sync_segment_buffers)
+        self._buffered_segments = []
+        self._path_buffer = PointBuffer()
+        self._control_buffer = PointBuffer()
+        self._handle_buffer = PointBuffer()
+
+        # Running path statistics, kept in step with the geometry cache
+        self._segment_lengths = []  # Length of each cached segment (mm)
+        self._segment_counts = Counter()  # Segment type -> count
+        self._path_length_mm = 0.0
+        self._curve_artists_shown = False  # Control/handle/preview artists may hold data
+
         # Current drawing state
         self.current_line_start = None  # For line mode: last point clicked
         self.current_curve = {
@@ -92,7 +127,15 @@ class PlotterGUI:
 
     def _setup_figure(self):
         """Setup the main GUI figure and controls."""
-        self.fig = plt.figure(figsize=(12, 8), facecolor=MONUMENTAL_DARK_BLUE)
+        # pyplot is imported on first use so importing this module stays cheap
+        import matplotlib.pyplot as plt
+
+        # No navigation toolbar: the canvas has fixed limits, and pan/zoom
+        # would only add mouse-event handling and full redraws
+        with plt.rc_context({'toolbar': 'None'}):
+            self.fig = plt.figure(figsize=(12, 8), facecolor=MONUMENTAL_DARK_BLUE)
+        if hasattr(self.fig.canvas, 'header_visible'):
+            self.fig.canvas.header_visible = False  # ipympl
         self.fig.canvas.manager.set_window_title("Pen Plotter Control")
 
         # Main drawing canvas
@@ -102,6 +145,31 @@ class PlotterGUI:
         self._setup_canvas()
         self._setup_controls()
 
+        # Path edits, live arm updates and status messages only redraw these
+        # artists over a cached background (arm after the path so it stays on top)
+        self._blit = BlitManager(self.fig.canvas, [
+            self.path_line,
+            self.control_handles,
+            self.control_points,
+            self.curve_preview,
+            self.clicked_points,
+            self.arm_line,
+            self.pen_marker,
+            self.status_text,
+        ])
+
+        # GUI updates from the drawing thread are queued and run on the main
+        # thread by a recurring timer (GUI toolkits are not thread-safe)
+        self._gui_queue = queue.Queue()
+        self._gui_timer = self.fig.canvas.new_timer(interval=LIVE_REDRAW_INTERVAL_MS)
+        self._gui_timer.add_callback(self._drain_gui_queue)
+
+        # Coalesce live position updates: at most one redraw pending at a time,
+        # intermediate positions are dropped
+        self._position_lock = threading.Lock()
+        self._pending_pos = None
+        self._redraw_scheduled = False
+
         # Connect mouse events
         self.fig.canvas.mpl_connect('button_press_event', self._on_click)
 
@@ -109,11 +177,10 @@ class PlotterGUI:
         """Setup the drawing canvas."""
         ax = self.ax_canvas
 
-        # Calculate workspace boundaries (origin-relative coordinates)
-        x_min = -BOARD_WIDTH / 2
-        x_max = BOARD_WIDTH / 2
-        y_min = PEN_OFFSET_MM  # Pen home position (160mm from origin)
-        y_max = PEN_OFFSET_MM + BOARD_HEIGHT  # Maximum reach (470mm from origin)
+        # Workspace boundaries (origin-relative coordinates)
+        x_min, x_max = WORKSPACE_X_MIN, WORKSPACE_X_MAX
+        y_min, y_max = WORKSPACE_Y_MIN, WORKSPACE_Y_MAX
+        self._bounds = (x_min, x_max, y_min, y_max)
 
         # Draw workspace rectangle
         ax.plot(
@@ -184,11 +251,23 @@ class PlotterGUI:
                      color=MONUMENTAL_CREAM, weight="bold")
         ax.set_xlim(x_min - 20, x_max + 20)
         ax.set_ylim(-20, y_max + 20)  # Show from origin to max reach
+        ax.set_autoscale_on(False)  # Limits are fixed; artists added later must not rescale
         ax.set_aspect("equal", adjustable="box")
 
-        # Legend - positioned outside plot area to the right
-        legend = ax.legend(loc="upper left", bbox_to_anchor=(1.02, 1), fontsize=9)
-        style_legend(legend, framealpha=0.8)
+        # Key - positioned outside plot area to the right. Plain colored
+        # annotations instead of ax.legend(): cheaper on every full redraw
+        handles, labels = ax.get_legend_handles_labels()
+        for i, (handle, label) in enumerate(zip(handles, labels)):
+            ax.annotate(
+                f"\u2014 {label}",
+                xy=(1.02, 1),
+                xycoords='axes fraction',
+                xytext=(0, -14 * i),
+                textcoords='offset points',
+                fontsize=9,
+                color=handle.get_color(),
+                verticalalignment='top'
+            )
 
         # Status text - positioned outside plot area to the left
         self.status_text = ax.text(
@@ -205,6 +284,10 @@ class PlotterGUI:
 
     def _setup_controls(self):
         """Setup control buttons and inputs."""
+        import matplotlib.pyplot as plt
+        from matplotlib.patches import Circle
+        from matplotlib.widgets import Button, Slider, TextBox
+
         button_color = MONUMENTAL_TAUPE
         hover_color = MONUMENTAL_ORANGE
         text_color = MONUMENTAL_CREAM
@@ -390,53 +473,56 @@ class PlotterGUI:
 
     def _on_mode_changed(self, mode):
         """Handle drawing mode change."""
-        if mode == self.drawing_mode:
-            return  # Already in this mode
+        with self._batch_redraws():
+            if mode == self.drawing_mode:
+                return  # Already in this mode
 
-        self.drawing_mode = mode
+            self.drawing_mode = mode
 
-        # Reset current drawing state (but keep completed segments)
-        self.current_line_start = None
-        self.current_curve = {
-            'start': None,
-            'control1': None,
-            'control2': None,
-            'end': None
-        }
-        self.current_rectangle = {
-            'corner1': None,
-            'corner2': None,
-            'corner3': None
-        }
-        self.current_circle = {
-            'center': None,
-            'radius_point': None
-        }
+            # Reset current drawing state (but keep completed segments)
+            self.current_line_start = None
+            self.current_curve = {
+                'start': None,
+                'control1': None,
+                'control2': None,
+                'end': None
+            }
+            self.current_rectangle = {
+                'corner1': None,
+                'corner2': None,
+                'corner3': None
+            }
+            self.current_circle = {
+                'center': None,
+                'radius_point': None
+            }
 
-        # Update button styling
-        self.btn_line_mode.color = MONUMENTAL_TAUPE
-        self.btn_curve_mode.color = MONUMENTAL_TAUPE
-        self.btn_rectangle_mode.color = MONUMENTAL_TAUPE
-        self.btn_circle_mode.color = MONUMENTAL_TAUPE
-
-        if mode == 'Line':
-            self.btn_line_mode.color = MONUMENTAL_ORANGE
-            self._update_status("Line mode: Click points to draw lines")
-        elif mode == 'Curve':
-            self.btn_curve_mode.color = MONUMENTAL_ORANGE
-            self._update_status("Curve mode: Click start → control1 → control2 → end")
-        elif mode == 'Rectangle':
-            self.btn_rectangle_mode.color = MONUMENTAL_ORANGE
-            self._update_status("Rectangle mode: Click corner → adjacent corner → width point")
-        elif mode == 'Circle':
-            self.btn_circle_mode.color = MONUMENTAL_ORANGE
-            self._update_status("Circle mode: Click center → radius point")
-
-        self._update_path_display()
-        self.fig.canvas.draw_idle()
+            # Update button styling
+            self.btn_line_mode.color = MONUMENTAL_TAUPE
+            self.btn_curve_mode.color = MONUMENTAL_TAUPE
+            self.btn_rectangle_mode.color = MONUMENTAL_TAUPE
+            self.btn_circle_mode.color = MONUMENTAL_TAUPE
+
+            if mode == 'Line':
+                self.btn_line_mode.color = MONUMENTAL_ORANGE
+                self._update_status("Line mode: Click points to draw lines")
+            elif mode == 'Curve':
+                self.btn_curve_mode.color = MONUMENTAL_ORANGE
+                self._update_status("Curve mode: Click start → control1 → control2 → end")
+            elif mode == 'Rectangle':
+                self.btn_rectangle_mode.color = MONUMENTAL_ORANGE
+                self._update_status("Rectangle mode: Click corner → adjacent corner → width point")
+            elif mode == 'Circle':
+                self.btn_circle_mode.color = MONUMENTAL_ORANGE
+                self._update_status("Circle mode: Click center → radius point")
+
+            self._update_path_display()
+            self._request_redraw()
 
     def _on_click(self, event):
         """Handle mouse click to add path points."""
+        from matplotlib.backend_bases import MouseButton
+
         # Only process left clicks on the canvas
         if event.inaxes != self.ax_canvas:
             return
@@ -445,13 +531,34 @@ class PlotterGUI:
         if self.is_drawing:
             return
 
+        # Throttle the redraw, never the click: presses within one frame of
+        # the last redraw (fast double clicks, event bursts) are still added,
+        # but their redraw waits for the next GUI timer tick
+        now = time.monotonic()
+        throttled = now - self._last_click_time < CLICK_MIN_INTERVAL_S
+        if not throttled:
+            self._last_click_time = now
+
         # Get origin-relative coordinates from GUI (no conversion needed)
         x, y = event.xdata, event.ydata
 
-        # Validate point is within workspace
-        try:
-            validate_point(x, y)
+        # Status and path updates for this click share a single redraw
+        with self._batch_redraws():
+            self._add_point(x, y)
+            if throttled:
+                self._defer_pending_redraw()
+
+    def _add_point(self, x: float, y: float):
+        """Add a clicked point to the segment being built in the current mode."""
+        # Same workspace bounds as validate_point(), tested inline - clicks
+        # outside the board are common and don't need an exception round-trip
+        x_min, x_max, y_min, y_max = self._bounds
+        if not (x_min <= x <= x_max and y_min <= y <= y_max):
+            self._update_status(f"Invalid point: ({x:.1f}, {y:.1f}) is outside the workspace "
+                                f"[{x_min}, {x_max}] x [{y_min}, {y_max}]mm", error=True)
+            return
 
+        try:
             if self.drawing_mode == 'Line':
                 # Line mode: create line segment from last end point to new point
                 if self.current_line_start is not None:
@@ -606,68 +713,123 @@ class PlotterGUI:
         except ValueError as e:
             self._update_status(f"Invalid point: {e}", error=True)
 
+    def _segment_display_points(self, segment):
+        """
+        Build the display geometry for one completed segment.
+
+        Returns:
+            (path_points, control_points, handle_points) as (N, 2) arrays
+        """
+        from penplotter.path.bezier import generate_bezier_curve
+
+        no_points = np.empty((0, 2))
+
+        if segment['type'] == 'line':
+            # Line segment endpoints
+            return np.array([segment['start'], segment['end']], dtype=float), no_points, no_points
+
+        if segment['type'] == 'curve':
+            curve_points = generate_bezier_curve(
+                segment['start'],
+                segment['end'],
+                [segment['control1'], segment['control2']],
+                num_samples=50
+            )
+            controls = np.array([segment['control1'], segment['control2']], dtype=float)
+            # Handle lines (start to control1, control2 to end)
+            handles = np.array([
+                segment['start'], segment['control1'],
+                [np.nan, np.nan],  # Break in line
+                segment['control2'], segment['end'],
+                [np.nan, np.nan]  # Break before next segment
+            ], dtype=float)
+            return curve_points, controls, handles
+
+        if segment['type'] == 'rectangle':
+            # Visualize rectangle as 4 connected lines
+            corners = segment['corners'] + [segment['corners'][0]]  # Close the rectangle
+            path = np.array(corners + [[np.nan, np.nan]], dtype=float)  # Break before next segment
+            return path, no_points, no_points
+
+        if segment['type'] == 'circle':
+            # Visualize circle using approximation points
+            center_x, center_y = segment['center']
+            radius = segment['radius']
+            num_points = 100
+            angles = np.linspace(0, 2 * np.pi, num_points + 1)
+            path = np.empty((num_points + 2, 2))
+            path[:-1, 0] = center_x + radius * np.cos(angles)
+            path[:-1, 1] = center_y + radius * np.sin(angles)
+            path[-1] = np.nan  # Break before next segment
+            return path, no_points, no_points
+
+        return no_points, no_points, no_points
+
+    def _sync_segment_buffers(self):
+        """
+        Bring the cached segment geometry in line with self.segments.
+
+        Segments are only ever appended, popped or cleared, so the cache keeps
+        the longest common prefix and only builds geometry for new segments.
+        """
+        cached = self._buffered_segments
+        common = 0
+        for cached_segment, segment in zip(cached, self.segments):
+            if cached_segment is not segment:
+                break
+            common += 1
+
+        while len(cached) > common:
+            removed = cached.pop()
+            self._path_buffer.pop()
+            self._control_buffer.pop()
+            self._handle_buffer.pop()
+            self._segment_counts[removed['type']] -= 1
+            self._path_length_mm -= self._segment_lengths.pop()
+
+        for segment in self.segments[common:]:
+            path, controls, handles = self._segment_display_points(segment)
+            cached.append(segment)
+            self._path_buffer.append(path)
+            self._control_buffer.append(controls)
+            self._handle_buffer.append(handles)
+
+            # Polyline length of the display geometry (NaN breaks are skipped)
+            deltas = np.diff(path, axis=0)
+            length = float(np.nansum(np.hypot(deltas[:, 0], deltas[:, 1])))
+            self._segment_counts[segment['type']] += 1
+            self._segment_lengths.append(length)
+            self._path_length_mm += length
+
+        if not cached:
+            self._path_length_mm = 0.0  # Don't carry float drift past a clear
+
     def _update_path_display(self):
         """Update the visualization of the current path."""
         from penplotter.path.bezier import generate_bezier_curve
 
-        # Collect all path points from completed segments
-        all_path_points = []
-        all_control_points = []
-        all_handle_lines = []
-
-        for segment in self.segments:
-            if segment['type'] == 'line':
-                # Add line segment endpoints
-                all_path_points.extend([segment['start'], segment['end']])
-            elif segment['type'] == 'curve':
-                # Generate curve visualization
-                curve_points = generate_bezier_curve(
-                    segment['start'],
-                    segment['end'],
-                    [segment['control1'], segment['control2']],
-                    num_samples=50
-                )
-                all_path_points.extend(curve_points)
-
-                # Add control points
-                all_control_points.extend([segment['control1'], segment['control2']])
-
-                # Add handle lines (start to control1, control2 to end)
-                all_handle_lines.extend([
-                    segment['start'], segment['control1'],
-                    [np.nan, np.nan],  # Break in line
-                    segment['control2'], segment['end'],
-                    [np.nan, np.nan]  # Break before next segment
-                ])
-            elif segment['type'] == 'rectangle':
-                # Visualize rectangle as 4 connected lines
-                corners = segment['corners'] + [segment['corners'][0]]  # Close the rectangle
-                all_path_points.extend(corners)
-                all_path_points.append([np.nan, np.nan])  # Break before next segment
-            elif segment['type'] == 'circle':
-                # Visualize circle using approximation points
-                import math
-                center_x, center_y = segment['center']
-                radius = segment['radius']
-                # Generate points around the circle
-                num_points = 100
-                circle_points = []
-                for i in range(num_points + 1):
-                    angle = 2 * math.pi * i / num_points
-                    x = center_x + radius * math.cos(angle)
-                    y = center_y + radius * math.sin(angle)
-                    circle_points.append((x, y))
-                all_path_points.extend(circle_points)
-                all_path_points.append([np.nan, np.nan])  # Break before next segment
-
-        # Show completed segments
-        if all_path_points:
-            points_array = np.array(all_path_points)
-            self.path_line.set_data(points_array[:, 0], points_array[:, 1])
-        else:
-            self.path_line.set_data([], [])
+        # Completed segments are cached; only new ones are generated
+        self._sync_segment_buffers()
+        path_points = self._path_buffer.points
+        self.path_line.set_data(path_points[:, 0], path_points[:, 1])
+
+        if self.drawing_mode == 'Line' and not self._segment_counts['curve']:
+            # Common polyline case: no Bezier controls, handles or preview
+            if self._curve_artists_shown:
+                self.control_points.set_data([], [])
+                self.control_handles.set_data([], [])
+                self.curve_preview.set_data([], [])
+                self._curve_artists_shown = False
+            if self.current_line_start is not None:
+                self.clicked_points.set_data([self.current_line_start[0]],
+                                             [self.current_line_start[1]])
+            else:
+                self.clicked_points.set_data([], [])
+            self._request_redraw(blit=True)
+            return
 
         # Show current drawing state
+        self._curve_artists_shown = True
         temp_points = []
         temp_controls = []
         temp_handles = []
@@ -714,9 +876,7 @@ class PlotterGUI:
                             [self.current_curve['control1'], self.current_curve['control2']],
                             num_samples=30
                         )
-                        if preview_points:
-                            preview_array = np.array(preview_points)
-                            self.curve_preview.set_data(preview_array[:, 0], preview_array[:, 1])
+                        self.curve_preview.set_data(preview_points[:, 0], preview_points[:, 1])
                     except:
                         self.curve_preview.set_data([], [])
 
@@ -726,19 +886,15 @@ class PlotterGUI:
                         temp_points.append(self.current_curve['end'])
 
         # Update current state visualizations
-        if temp_controls or all_control_points:
-            all_controls = all_control_points + temp_controls
-            control_array = np.array(all_controls)
-            self.control_points.set_data(control_array[:, 0], control_array[:, 1])
-        else:
-            self.control_points.set_data([], [])
+        control_array = self._control_buffer.points
+        if temp_controls:
+            control_array = np.concatenate([control_array, np.array(temp_controls, dtype=float)])
+        self.control_points.set_data(control_array[:, 0], control_array[:, 1])
 
-        if temp_handles or all_handle_lines:
-            all_handles = all_handle_lines + temp_handles
-            handle_array = np.array(all_handles)
-            self.control_handles.set_data(handle_array[:, 0], handle_array[:, 1])
-        else:
-            self.control_handles.set_data([], [])
+        handle_array = self._handle_buffer.points
+        if temp_handles:
+            handle_array = np.concatenate([handle_array, np.array(temp_handles, dtype=float)])
+        self.control_handles.set_data(handle_array[:, 0], handle_array[:, 1])
 
         if self.drawing_mode != 'Curve' or self.current_curve['start'] is None:
             self.curve_preview.set_data([], [])
@@ -750,15 +906,69 @@ class PlotterGUI:
         else:
             self.clicked_points.set_data([], [])
 
-        self.fig.canvas.draw_idle()
+        self._request_redraw(blit=True)
 
     def _update_actuator_display(self, x: float, y: float):
         """Update the actuator arm visualization."""
         self.current_pen_position = (x, y)
         # Draw arm from origin to pen position
-        self.arm_line.set_data([0, x], [0, y])
-        self.pen_marker.set_data([x], [y])
-        self.fig.canvas.draw_idle()
+        self._arm_x[1] = x
+        self._arm_y[1] = y
+        self._pen_x[0] = x
+        self._pen_y[0] = y
+        self.arm_line.set_data(self._arm_x, self._arm_y)
+        self.pen_marker.set_data(self._pen_x, self._pen_y)
+        self._request_redraw(blit=True)
+
+    def _queue_actuator_update(self, x: float, y: float):
+        """Record the latest pen position and schedule a single redraw."""
+        with self._position_lock:
+            self._pending_pos = (x, y)
+            if self._redraw_scheduled:
+                return
+            self._redraw_scheduled = True
+        self._post(self._flush_pending_position)
+
+    def _flush_pending_position(self):
+        """Draw the most recent queued pen position."""
+        with self._position_lock:
+            pos = self._pending_pos
+            self._pending_pos = None
+            self._redraw_scheduled = False
+        if pos is not None:
+            self._update_actuator_display(*pos)
+
+    def _post(self, callback, *args, **kwargs):
+        """Queue a GUI update to run on the main thread (safe from any thread)."""
+        self._gui_queue.put((callback, args, kwargs))
+
+    def _drain_gui_queue(self):
+        """Run all queued GUI updates. Called by the GUI timer on the main thread."""
+        # Status and arm updates posted in the same tick share one blit
+        with self._batch_redraws():
+            while True:
+                try:
+                    callback, args, kwargs = self._gui_queue.get_nowait()
+                except queue.Empty:
+                    break
+                try:
+                    callback(*args, **kwargs)
+                except Exception:
+                    traceback.print_exc()
+
+        # Catch up on redraws skipped while the window was minimized
+        if self._redraw_skipped and not self._window_minimized():
+            self._redraw_skipped = False
+            self.fig.canvas.draw_idle()
+
+    def _window_minimized(self) -> bool:
+        """Whether the GUI window is currently minimized (Tk and Qt backends)."""
+        window = getattr(self.fig.canvas.manager, 'window', None)
+        if hasattr(window, 'wm_state'):  # Tk
+            return window.wm_state() == 'iconic'
+        if hasattr(window, 'isMinimized'):  # Qt
+            return window.isMinimized()
+        return False
 
     def _update_status(self, message: str, error: bool = False):
         """Update the status text."""
@@ -769,13 +979,72 @@ class PlotterGUI:
         connection_status = "Connected" if self.is_connected else "Disconnected"
         full_message = f"{prefix}{connection_status}\n{message}"
 
+        # Unchanged text (the prefix also fixes the color) - nothing to redraw
+        if full_message == self.status_text.get_text():
+            return
+
         self.status_text.set_text(full_message)
         if error:
             self.status_text.set_color(MONUMENTAL_ORANGE)
         else:
             self.status_text.set_color(MONUMENTAL_CREAM)
 
-        self.fig.canvas.draw_idle()
+        self._request_redraw(blit=True)
+
+    def _request_redraw(self, blit: bool = False):
+        """
+        Redraw the figure, or defer it while inside _batch_redraws().
+
+        Args:
+            blit: If True, only the blitted artists changed
+        """
+        if self._batching_redraws:
+            self._redraw_pending = True
+            if not blit:
+                self._full_redraw_pending = True
+        elif self._window_minimized():
+            # Nothing to see - artists are updated, drawing waits for restore
+            self._redraw_skipped = True
+        elif blit:
+            self._blit.update()
+        else:
+            self.fig.canvas.draw_idle()
+
+    @contextmanager
+    def _batch_redraws(self):
+        """
+        Coalesce all redraws requested inside the block into one.
+
+        The single redraw is a blit if only blitted artists changed,
+        otherwise a full draw_idle().
+        """
+        if self._batching_redraws:
+            # Nested - the outermost block draws
+            yield
+            return
+
+        self._batching_redraws = True
+        self._redraw_pending = False
+        self._full_redraw_pending = False
+        try:
+            yield
+        finally:
+            self._batching_redraws = False
+            if self._redraw_pending:
+                self._request_redraw(blit=not self._full_redraw_pending)
+
+    def _defer_pending_redraw(self):
+        """Hand the redraw pending in the current batch to the next GUI timer tick.
+
+        Deferred redraws posted in the same tick are coalesced by the batch
+        in _drain_gui_queue().
+        """
+        if not self._redraw_pending:
+            return
+        blit = not self._full_redraw_pending
+        self._redraw_pending = False
+        self._full_redraw_pending = False
+        self._post(self._request_redraw, blit=blit)
 
     def _on_port_changed(self, text):
         """Handle serial port input change."""
@@ -784,20 +1053,49 @@ class PlotterGUI:
 
     def _on_detect_ports(self, event):
         """Handle detect ports button click."""
-        # Get list of available serial ports
-        ports = serial.tools.list_ports.comports()
+        if (self._port_scan_time is not None
+                and time.monotonic() - self._port_scan_time <= PORT_SCAN_CACHE_S):
+            self._show_detected_ports()
+            return
+
+        if self._port_scan_running:
+            return
+
+        # Enumeration can block for hundreds of ms - keep it off the GUI thread
+        self._port_scan_running = True
+        self._update_status("Scanning for USB serial ports...")
+        thread = threading.Thread(target=self._scan_ports)
+        thread.daemon = True
+        thread.start()
 
-        # Filter for USB serial ports only (exclude Bluetooth, WiFi, etc.)
-        usb_ports = [
-            port.device for port in ports
-            if 'usb' in port.device.lower() or
-               'acm' in port.device.lower() or
-               'usbserial' in port.device.lower() or
-               'usbmodem' in port.device.lower()
-        ]
+    def _scan_ports(self):
+        """Enumerate USB serial ports (worker thread) and post the result to the GUI."""
+        import serial.tools.list_ports
 
-        self.available_ports = usb_ports
+        try:
+            # Filter for USB serial ports only (exclude Bluetooth, WiFi, etc.)
+            ports = [
+                port.device for port in serial.tools.list_ports.comports()
+                if _USB_PORT_RE.search(port.device) and 'bluetooth' not in port.device.lower()
+            ]
+        except Exception as e:
+            self._post(self._update_status, f"Port detection failed: {e}", error=True)
+            ports = None
 
+        self._post(self._apply_detected_ports, ports)
+
+    def _apply_detected_ports(self, ports: Optional[List[str]]):
+        """Store a finished port scan and show it (None if the scan failed)."""
+        self._port_scan_running = False
+        if ports is None:
+            return
+
+        self.available_ports = ports
+        self._port_scan_time = time.monotonic()
+        self._show_detected_ports()
+
+    def _show_detected_ports(self):
+        """Report the detected ports and select the first one."""
         if self.available_ports:
             port_list = "\n".join(self.available_ports)
             self._update_status(f"USB ports found:\n{port_list}")
@@ -809,104 +1107,113 @@ class PlotterGUI:
 
     def _on_connect(self, event):
         """Handle connect button click."""
-        if self.is_connected:
-            # Disconnect
-            if self.plotter:
-                self.plotter.disconnect()
-                self.plotter = None
-            self.is_connected = False
-            self.btn_connect.label.set_text('Connect')
-            self.status_circle.set_color(MONUMENTAL_TAUPE)  # Gray when disconnected
-            self._update_status("Disconnected")
-        else:
-            # Connect
-            try:
-                self.plotter = Plotter(self.serial_port)
-                self.plotter.connect()  # Actually connect to the plotter
-                self.is_connected = True
-                self.btn_connect.label.set_text('Disconnect')
-                self.status_circle.set_color('#00ff00')  # Green when connected
-                self._update_status(f"Connected to {self.serial_port}")
-            except Exception as e:
-                self._update_status(f"Connection failed: {e}", error=True)
-                self.status_circle.set_color('#ff0000')  # Red on error
+        with self._batch_redraws():
+            if self.is_connected:
+                # Disconnect
                 if self.plotter:
+                    self.plotter.disconnect()
                     self.plotter = None
-
-        self.fig.canvas.draw_idle()
+                self.is_connected = False
+                self.btn_connect.label.set_text('Connect')
+                self.status_circle.set_color(MONUMENTAL_TAUPE)  # Gray when disconnected
+                self._update_status("Disconnected")
+            else:
+                # Connect
+                try:
+                    self.plotter = Plotter(self.serial_port)
+                    self.plotter.connect()  # Actually connect to the plotter
+                    self.is_connected = True
+                    self.btn_connect.label.set_text('Disconnect')
+                    self.status_circle.set_color('#00ff00')  # Green when connected
+                    self._update_status(f"Connected to {self.serial_port}")
+                except Exception as e:
+                    self._update_status(f"Connection failed: {e}", error=True)
+                    self.status_circle.set_color('#ff0000')  # Red on error
+                    if self.plotter:
+                        self.plotter = None
+
+            self._request_redraw()
 
     def _on_clear(self, event):
         """Handle clear button click."""
-        if not self.is_drawing:
-            self.segments = []
-            self.current_line_start = None
-            self.current_curve = {
-                'start': None,
-                'control1': None,
-                'control2': None,
-                'end': None
-            }
-            self._update_path_display()
-            self._update_status("All segments cleared")
+        with self._batch_redraws():
+            if not self.is_drawing:
+                self.segments = []
+                self.current_line_start = None
+                self.current_curve = {
+                    'start': None,
+                    'control1': None,
+                    'control2': None,
+                    'end': None
+                }
+                self._update_path_display()
+                self._update_status("All segments cleared")
 
     def _on_undo(self, event):
         """Handle undo button click."""
-        if not self.is_drawing:
-            if self.drawing_mode == 'Line':
-                # Undo in line mode: remove current start point or last segment
-                if self.current_line_start is not None:
-                    # Remove the pending start point
-                    self.current_line_start = None
-                    # Set start to the end of the last segment if exists
-                    if len(self.segments) > 0:
-                        last_seg = self.segments[-1]
-                        self.current_line_start = last_seg['end']
-                    self._update_status("Removed pending point. Click to continue from last position")
-                elif len(self.segments) > 0:
-                    # Remove last segment
-                    removed = self.segments.pop()
-                    if removed['type'] == 'line':
-                        # Set start point to the removed segment's start
-                        self.current_line_start = removed['start']
-                        self._update_status(f"Removed line segment. {len(self.segments)} segments remaining")
-                    else:
-                        self._update_status(f"Removed curve segment. {len(self.segments)} segments remaining")
-                self._update_path_display()
-
-            elif self.drawing_mode == 'Curve':
-                # Undo in curve mode: remove last control point or last segment
-                if self.current_curve['end'] is not None:
-                    self.current_curve['end'] = None
-                    self._update_status("Removed end point. Click end point")
-                elif self.current_curve['control2'] is not None:
-                    self.current_curve['control2'] = None
-                    self._update_status("Removed control point 2. Click control point 2")
-                elif self.current_curve['control1'] is not None:
-                    self.current_curve['control1'] = None
-                    self._update_status("Removed control point 1. Click control point 1")
-                elif self.current_curve['start'] is not None:
-                    self.current_curve['start'] = None
-                    self._update_status("Removed start point. Click start point")
-                elif len(self.segments) > 0:
-                    removed = self.segments.pop()
-                    seg_type = removed['type']
-                    self._update_status(f"Removed {seg_type} segment. {len(self.segments)} segments remaining")
-                self._update_path_display()
+        with self._batch_redraws():
+            if not self.is_drawing:
+                if self.drawing_mode == 'Line':
+                    # Undo in line mode: remove current start point or last segment
+                    if self.current_line_start is not None:
+                        # Remove the pending start point
+                        self.current_line_start = None
+                        # Set start to the end of the last segment if exists
+                        if len(self.segments) > 0:
+                            last_seg = self.segments[-1]
+                            self.current_line_start = last_seg['end']
+                        self._update_status(
+                            "Removed pending point. Click to continue from last position"
+                        )
+                    elif len(self.segments) > 0:
+                        # Remove last segment
+                        removed = self.segments.pop()
+                        if removed['type'] == 'line':
+                            # Set start point to the removed segment's start
+                            self.current_line_start = removed['start']
+                            removed_type = 'line'
+                        else:
+                            removed_type = 'curve'
+                        self._update_status(f"Removed {removed_type} segment. "
+                                            f"{len(self.segments)} segments remaining")
+                    self._update_path_display()
+
+                elif self.drawing_mode == 'Curve':
+                    # Undo in curve mode: remove last control point or last segment
+                    if self.current_curve['end'] is not None:
+                        self.current_curve['end'] = None
+                        self._update_status("Removed end point. Click end point")
+                    elif self.current_curve['control2'] is not None:
+                        self.current_curve['control2'] = None
+                        self._update_status("Removed control point 2. Click control point 2")
+                    elif self.current_curve['control1'] is not None:
+                        self.current_curve['control1'] = None
+                        self._update_status("Removed control point 1. Click control point 1")
+                    elif self.current_curve['start'] is not None:
+                        self.current_curve['start'] = None
+                        self._update_status("Removed start point. Click start point")
+                    elif len(self.segments) > 0:
+                        removed = self.segments.pop()
+                        seg_type = removed['type']
+                        self._update_status(f"Removed {seg_type} segment. "
+                                            f"{len(self.segments)} segments remaining")
+                    self._update_path_display()
 
     def _on_home(self, event):
         """Handle home button click."""
-        if self.is_connected and not self.is_drawing:
-            try:
-                self._update_status("Homing plotter...")
-                self.plotter.home()
-                # Update actuator display to home position
-                self._update_actuator_display(0, PEN_OFFSET_MM)
-                # Reset sliders to home position
-                self.rotate_slider.set_val(0)
-                self.linear_slider.set_val(PEN_OFFSET_MM)
-                self._update_status("Plotter homed successfully")
-            except Exception as e:
-                self._update_status(f"Homing failed: {e}", error=True)
+        with self._batch_redraws():
+            if self.is_connected and not self.is_drawing:
+                try:
+                    self._update_status("Homing plotter...")
+                    self.plotter.home()
+                    # Update actuator display to home position
+                    self._update_actuator_display(0, PEN_OFFSET_MM)
+                    # Reset sliders to home position
+                    self.rotate_slider.set_val(0)
+                    self.linear_slider.set_val(PEN_OFFSET_MM)
+                    self._update_status("Plotter homed successfully")
+                except Exception as e:
+                    self._update_status(f"Homing failed: {e}", error=True)
 
     def _on_stop(self, event):
         """Handle stop button click - emergency stop."""
@@ -924,12 +1231,8 @@ class PlotterGUI:
         if self.is_connected and not self.is_drawing:
             try:
                 total_radius = int(val)
-                # Convert total radius to extension
-                extension_mm = total_radius - PEN_OFFSET_MM
-                # Convert extension to ADC value
-                adc_value = int(extension_mm * ADC_PER_MM + ADC_MIN)
-                # Clamp to valid range
-                adc_value = max(0, min(834, adc_value))
+                # Convert total radius to a (clamped) ADC value
+                _, adc_value = polar_to_hardware(0.0, total_radius)
 
                 self._update_status(f"Moving linear actuator to {total_radius}mm (ADC: {adc_value})...")
                 self.plotter.linear(adc_value)
@@ -948,7 +1251,7 @@ class PlotterGUI:
             try:
                 angle_deg = int(val)
                 # Convert degrees to microsteps
-                microsteps = int(angle_deg * MICROSTEPS_PER_DEGREE)
+                microsteps, _ = polar_to_hardware(angle_deg, PEN_OFFSET_MM)
 
                 self._update_status(f"Rotating to {angle_deg}° ({microsteps} steps)...")
                 self.plotter.rotate(microsteps)
@@ -975,14 +1278,17 @@ class PlotterGUI:
         if self.is_drawing:
             return
 
-        # Print segment statistics
-        line_count = sum(1 for seg in self.segments if seg['type'] == 'line')
-        curve_count = sum(1 for seg in self.segments if seg['type'] == 'curve')
+        # Print segment statistics (maintained incrementally as segments change)
+        self._sync_segment_buffers()
+        counts = self._segment_counts
 
         print(f"\nPath Statistics:")
         print(f"  Total segments: {len(self.segments)}")
-        print(f"    Lines: {line_count}")
-        print(f"    Curves: {curve_count}")
+        print(f"    Lines: {counts['line']}")
+        print(f"    Curves: {counts['curve']}")
+        print(f"    Rectangles: {counts['rectangle']}")
+        print(f"    Circles: {counts['circle']}")
+        print(f"  Path length: {self._path_length_mm:.1f}mm")
 
         # Start drawing in a separate thread
         self.is_drawing = True
@@ -993,23 +1299,24 @@ class PlotterGUI:
     def _execute_drawing(self):
         """Execute the drawing path with live actuator arm updates."""
         try:
-            from penplotter.control.primitives import draw_line
             from penplotter.control.curves import draw_curve
-            from penplotter.control.shapes import draw_rectangle, draw_circle
+            from penplotter.control.primitives import draw_line
+            from penplotter.control.shapes import draw_circle, draw_rectangle
 
             # Home before drawing
-            self._update_status("Homing plotter...")
+            self._post(self._update_status, "Homing plotter...")
+            # HOME is acknowledged only once the move has finished, so no
+            # settle delay is needed here
             self.plotter.home()
-            time.sleep(1)
 
             # Setup progress callback for live position updates
             def on_position_update(current_pos, segment_progress):
                 """Called frequently during drawing for live position updates."""
                 if current_pos:
-                    self._update_actuator_display(current_pos[0], current_pos[1])
+                    self._queue_actuator_update(current_pos[0], current_pos[1])
 
             start_time = time.time()
-            self._update_status(f"Drawing {len(self.segments)} segments...")
+            self._post(self._update_status, f"Drawing {len(self.segments)} segments...")
 
             # Draw each segment in order
             for i, segment in enumerate(self.segments):
@@ -1055,24 +1362,25 @@ class PlotterGUI:
             end_time = time.time()
             duration = end_time - start_time
 
-            # Count segment types
-            line_count = sum(1 for seg in self.segments if seg['type'] == 'line')
-            curve_count = sum(1 for seg in self.segments if seg['type'] == 'curve')
-            rectangle_count = sum(1 for seg in self.segments if seg['type'] == 'rectangle')
-            circle_count = sum(1 for seg in self.segments if seg['type'] == 'circle')
+            # Segment type counts (segments can't change while drawing)
+            counts = self._segment_counts
+            line_count = counts['line']
+            curve_count = counts['curve']
+            rectangle_count = counts['rectangle']
+            circle_count = counts['circle']
 
-            self._update_status(f"Drawing complete!\n"
-                                f"Drew {len(self.segments)} segments ({line_count} lines, {curve_count} curves, "
-                                f"{rectangle_count} rectangles, {circle_count} circles) in {duration:.1f}s")
+            self._post(self._update_status, f"Drawing complete!\n"
+                       f"Drew {len(self.segments)} segments ({line_count} lines, "
+                       f"{curve_count} curves, {rectangle_count} rectangles, "
+                       f"{circle_count} circles) in {duration:.1f}s")
 
             # Home after drawing
-            self._update_status("Returning to home...")
+            self._post(self._update_status, "Returning to home...")
             self.plotter.home()
-            self._update_actuator_display(0, PEN_OFFSET_MM)
+            self._queue_actuator_update(0, PEN_OFFSET_MM)
 
         except Exception as e:
-            self._update_status(f"Drawing failed: {e}", error=True)
-            import traceback
+            self._post(self._update_status, f"Drawing failed: {e}", error=True)
             traceback.print_exc()
 
         finally:
@@ -1080,6 +1388,9 @@ class PlotterGUI:
 
     def run(self):
         """Start the GUI event loop."""
+        import matplotlib.pyplot as plt
+
+        self._gui_timer.start()
         plt.show()
 
 
@@ -1096,6 +1407,9 @@ def main():
     print("=" * 60)
     print()
 
+    # Library status messages are logged - show them on the console
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
     gui = PlotterGUI()
     gui.run()
 
@@ -5,23 +5,36 @@ This module provides live plotting capabilities that update as the pen
 plotter draws, showing the planned path vs executed path and progress metrics.
 """
 
-import matplotlib.pyplot as plt
-from matplotlib.animation import FuncAnimation
-import numpy as np
-from typing import List, Tuple, Optional
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from io import BytesIO
 from pathlib import Path
+from typing import List, Optional, Tuple, Union
 
+import numpy as np
+from matplotlib.patches import Circle, Patch, Rectangle
+
+from penplotter.config import (
+    LIVE_REDRAW_INTERVAL_MS,
+    PEN_OFFSET_MM,
+    WORKSPACE_X_MAX,
+    WORKSPACE_X_MIN,
+    WORKSPACE_Y_MAX,
+    WORKSPACE_Y_MIN,
+)
+from penplotter.visualization.blit import BlitManager
+from penplotter.visualization.buffer import PointBuffer
 from penplotter.visualization.styles import (
-    MONUMENTAL_ORANGE,
     MONUMENTAL_BLUE,
     MONUMENTAL_CREAM,
-    MONUMENTAL_YELLOW_ORANGE,
     MONUMENTAL_DARK_BLUE,
+    MONUMENTAL_ORANGE,
+    MONUMENTAL_YELLOW_ORANGE,
     apply_dark_style,
-    style_legend,
-    format_time_label
+    format_time_label,
 )
-from penplotter.config import BOARD_WIDTH, BOARD_HEIGHT, PEN_OFFSET_MM
 
 
 class LivePlotter:
@@ -33,20 +46,46 @@ class LivePlotter:
     - Executed path (growing orange line as drawing progresses)
     - Current pen position marker
     - Progress along path (segment completion percentage)
+
+    In headless mode the figure is rendered with Agg only when saved: no
+    pyplot, no GUI window and no per-update redraws.
     """
 
-    def __init__(self, planned_path: List[Tuple[float, float]]):
+    def __init__(self, planned_path: List[Tuple[float, float]], headless: bool = False):
         """
         Initialize the live plotter.
 
         Args:
             planned_path: List of (x, y) coordinates defining the complete path (origin-relative)
+            headless: If True, only render when save() is called (for saving
+                snapshots without a display)
         """
+        self.headless = headless
+
         # Store and display origin-relative coordinates directly
         self.planned_path = np.array(planned_path)
         self.executed_path = []
         self.current_position = None
 
+        # Executed points already copied into the line data; update_progress
+        # only appends the new tail of executed_path
+        self._executed_buffer = PointBuffer()
+        # Executed points already drawn into the blit background
+        self._baked_points = 0
+
+        # Values the progress text was last built from; it is only rebuilt
+        # when one of them changes
+        self._progress_text_key = None
+
+        # Reused line data for the actuator arm (origin -> pen)
+        self._arm_x = np.zeros(2)
+        self._arm_y = np.zeros(2)
+
+        # Redraw throttling - progress can be reported far faster than a
+        # screen refresh is useful
+        self._last_draw_time = 0.0
+        self._min_draw_interval = LIVE_REDRAW_INTERVAL_MS / 1000.0
+
         # Progress tracking
         self.total_segments = len(planned_path) - 1 if len(planned_path) > 1 else 0
         self.completed_segments = 0
@@ -62,7 +101,18 @@ class LivePlotter:
 
     def _setup_figure(self):
         """Set up the matplotlib figure and axes."""
-        self.fig = plt.figure(figsize=(10, 8), facecolor=MONUMENTAL_DARK_BLUE)
+        if self.headless:
+            # Plain Agg canvas - no pyplot figure manager or GUI event loop
+            from matplotlib.backends.backend_agg import FigureCanvasAgg
+            from matplotlib.figure import Figure
+
+            self.fig = Figure(figsize=(10, 8), facecolor=MONUMENTAL_DARK_BLUE)
+            FigureCanvasAgg(self.fig)
+        else:
+            # pyplot is imported on first use so importing this module stays cheap
+            import matplotlib.pyplot as plt
+
+            self.fig = plt.figure(figsize=(10, 8), facecolor=MONUMENTAL_DARK_BLUE)
 
         # Create subplots: XY trajectory (top, larger), Progress bar (bottom, smaller)
         # Use gridspec for custom height ratios
@@ -80,26 +130,43 @@ class LivePlotter:
         # Setup progress plot
         self._setup_progress_plot()
 
+        # Progress updates only redraw the changing artists over a cached
+        # background (in zorder, so the arm and marker stay on top)
+        self._blit = BlitManager(self.fig.canvas, [
+            self.arm_line,
+            self.position_marker,
+            self.progress_bar,
+            self.progress_text,
+        ], background_artists=[
+            # The executed path is part of the background: new segments are
+            # drawn into it once through the tail line, so per-frame drawing
+            # doesn't grow with the path length. A full redraw draws the
+            # whole executed_line.
+            self.executed_line,
+            self._executed_tail,
+        ])
+        self._draw_cid = self.fig.canvas.mpl_connect('draw_event', self._on_draw)
+
     def _setup_trajectory_plot(self):
         """Setup the XY trajectory plot."""
         ax = self.ax_trajectory
 
         # Plot workspace boundaries (origin-relative coordinates)
-        x_min = -BOARD_WIDTH / 2
-        x_max = BOARD_WIDTH / 2
-        y_min = PEN_OFFSET_MM  # Pen home position (160mm from origin)
-        y_max = PEN_OFFSET_MM + BOARD_HEIGHT  # Maximum reach (470mm from origin)
-
-        # Draw workspace rectangle
-        ax.plot(
-            [x_min, x_max, x_max, x_min, x_min],
-            [y_min, y_min, y_max, y_max, y_min],
-            color=MONUMENTAL_CREAM,
+        x_min, x_max = WORKSPACE_X_MIN, WORKSPACE_X_MAX
+        y_min, y_max = WORKSPACE_Y_MIN, WORKSPACE_Y_MAX
+
+        # Draw workspace rectangle (static - only ever drawn into the blit background)
+        ax.add_patch(Rectangle(
+            (x_min, y_min),
+            x_max - x_min,
+            y_max - y_min,
+            fill=False,
+            edgecolor=MONUMENTAL_CREAM,
             alpha=0.3,
             linestyle="--",
             linewidth=1,
             label="Workspace"
-        )
+        ))
 
         # Plot planned path (full path in origin-relative coords)
         if len(self.planned_path) > 0:
@@ -109,7 +176,8 @@ class LivePlotter:
                 color=MONUMENTAL_BLUE,
                 alpha=0.5,
                 linewidth=2,
-                label="Planned path"
+                label="Planned path",
+                rasterized=True  # Long paths: one image in PDF/SVG output
             )
 
         # Initialize executed path line (will be updated)
@@ -118,20 +186,33 @@ class LivePlotter:
             color=MONUMENTAL_ORANGE,
             linewidth=3,
             label="Executed path",
+            rasterized=True,
             zorder=5
         )
-
-        # Initialize current position marker
-        self.position_marker, = ax.plot(
+        # Newly executed segments, drawn into the blit background (round caps
+        # so consecutive tails meet like the round joins of executed_line)
+        self._executed_tail, = ax.plot(
             [], [],
-            marker='o',
-            markersize=10,
-            color=MONUMENTAL_YELLOW_ORANGE,
-            markeredgecolor=MONUMENTAL_CREAM,
-            markeredgewidth=2,
+            color=MONUMENTAL_ORANGE,
+            linewidth=3,
+            solid_capstyle='round',
+            rasterized=True,
+            zorder=5
+        )
+
+        # Initialize current position marker - a single circle patch that is
+        # moved with set_center(); hidden until the first position arrives
+        self.position_marker = Circle(
+            (0, 0),
+            radius=8,
+            facecolor=MONUMENTAL_YELLOW_ORANGE,
+            edgecolor=MONUMENTAL_CREAM,
+            linewidth=2,
             label="Current position",
+            visible=False,
             zorder=10
         )
+        ax.add_patch(self.position_marker)
 
         # Initialize actuator arm visualization
         self.arm_line, = ax.plot(
@@ -148,12 +229,34 @@ class LivePlotter:
         ax.set_ylabel("Y Position from rotation axis (mm)", fontsize=12, color=MONUMENTAL_CREAM)
         ax.set_title("Trajectory", fontsize=14, color=MONUMENTAL_CREAM, weight="bold")
 
+        # Fixed limits (workspace plus the arm's origin) so the blitted
+        # background never goes stale through autoscaling
+        ax.set_xlim(x_min - 20, x_max + 20)
+        ax.set_ylim(-20, y_max + 20)
+        ax.set_autoscale_on(False)
+
         # Set equal aspect ratio
         ax.set_aspect("equal", adjustable="box")
 
-        # Legend
-        legend = ax.legend(loc="upper right", fontsize=9)
-        style_legend(legend, framealpha=0.8)
+        # Key - plain colored annotations instead of ax.legend(), drawn once
+        # into the blit background
+        handles, labels = ax.get_legend_handles_labels()
+        for i, (handle, label) in enumerate(zip(handles, labels)):
+            if isinstance(handle, Patch):
+                color = handle.get_facecolor() if handle.get_fill() else handle.get_edgecolor()
+            else:
+                color = handle.get_color()
+            ax.annotate(
+                f"\u2014 {label}",
+                xy=(0.98, 0.98),
+                xycoords='axes fraction',
+                xytext=(0, -14 * i),
+                textcoords='offset points',
+                fontsize=9,
+                color=color,
+                horizontalalignment='right',
+                verticalalignment='top'
+            )
 
     def _setup_progress_plot(self):
         """Setup the progress plot."""
@@ -194,17 +297,33 @@ class LivePlotter:
         executed_path: List[Tuple[float, float]],
         completed_segments: int,
         elapsed_time: float,
-        estimated_total_time: Optional[float] = None
+        estimated_total_time: Optional[float] = None,
+        force: bool = False
     ):
         """
         Update the visualization with new progress data.
 
+        The plot is redrawn at most every LIVE_REDRAW_INTERVAL_MS; updates in
+        between only change the artists' data. The final update (all segments
+        completed) is always drawn.
+
         Args:
             executed_path: List of executed points so far
             completed_segments: Number of segments completed
             elapsed_time: Time elapsed since start (seconds)
             estimated_total_time: Estimated total execution time (seconds)
+            force: If True, redraw even if the last redraw was very recent
         """
+        # executed_path normally only grows between updates - copy just the
+        # new points, and start over if it was replaced by a shorter path
+        if len(executed_path) < len(self._executed_buffer):
+            self._executed_buffer.clear()
+            self._baked_points = 0
+            self._blit.invalidate()
+        new_points = executed_path[len(self._executed_buffer):]
+        if len(new_points) > 0:
+            self._executed_buffer.append(np.asarray(new_points, dtype=np.float64).reshape(-1, 2))
+
         self.executed_path = executed_path
         self.completed_segments = completed_segments
         self.elapsed_time = elapsed_time
@@ -218,28 +337,65 @@ class LivePlotter:
             self.current_position = executed_path[-1]
 
         # Update plots
-        self._update_plots()
+        self._update_plots(force=force or completed_segments >= self.total_segments)
+
+    def _update_plots(self, force: bool = False):
+        """
+        Update the plot elements with current data.
 
-    def _update_plots(self):
-        """Update the plot elements with current data."""
+        Args:
+            force: If True, redraw regardless of the redraw throttle
+        """
         # Update executed path line (display origin-relative coordinates directly)
-        if len(self.executed_path) > 0:
-            executed_array = np.array(self.executed_path)
-            self.executed_line.set_data(executed_array[:, 0], executed_array[:, 1])
+        if len(self._executed_buffer) > 0:
+            executed_array = self._executed_buffer.points
+            self.executed_line.set_xdata(executed_array[:, 0])
+            self.executed_line.set_ydata(executed_array[:, 1])
 
         # Update current position marker (display origin-relative coordinates directly)
         if self.current_position is not None:
             pos_x = self.current_position[0]
             pos_y = self.current_position[1]
-            self.position_marker.set_data([pos_x], [pos_y])
+            self.position_marker.set_center((pos_x, pos_y))
+            self.position_marker.set_visible(True)
 
             # Update actuator arm to current position
-            self.arm_line.set_data([0, pos_x], [0, pos_y])
+            self._arm_x[1] = pos_x
+            self._arm_y[1] = pos_y
+            self.arm_line.set_xdata(self._arm_x)
+            self.arm_line.set_ydata(self._arm_y)
 
         # Update progress bar
         self.progress_bar.set_width(self.progress_percentage)
 
-        # Update progress text
+        # Blit the changed artists (full draw_idle until a background exists),
+        # throttled to the redraw interval. Headless plotters aren't drawn
+        # here, but keep the text current for save()
+        now = time.perf_counter()
+        if not self.headless and not force and now - self._last_draw_time < self._min_draw_interval:
+            return
+        self._last_draw_time = now
+
+        # Update progress text - only on drawn frames, and only when a shown
+        # value changed (times are shown to 0.1s at most)
+        text_key = (
+            self.completed_segments,
+            round(self.elapsed_time, 1),
+            self.estimated_total_time
+        )
+        if text_key != self._progress_text_key:
+            self._progress_text_key = text_key
+            self.progress_text.set_text(self._format_progress_text())
+
+        if self.headless:
+            # Nothing on screen - save() renders the current state
+            return
+
+        self._bake_executed_tail()
+        self._blit.update()
+
+    def _format_progress_text(self) -> str:
+        """Build the segment count, percentage and timing text."""
         progress_str = f"{self.completed_segments}/{self.total_segments} segments "
         progress_str += f"({self.progress_percentage:.1f}%)\n"
         progress_str += f"Time: {format_time_label(self.elapsed_time)}"
@@ -250,10 +406,25 @@ class LivePlotter:
                 progress_str += f" / {format_time_label(self.estimated_total_time)}"
                 progress_str += f"\n(~{format_time_label(remaining)} remaining)"
 
-        self.progress_text.set_text(progress_str)
+        return progress_str
+
+    def _bake_executed_tail(self):
+        """Draw the executed points added since the last frame into the background."""
+        n_points = len(self._executed_buffer)
+        if not self._blit.supports_blit or n_points <= self._baked_points:
+            return
+
+        # Start from the last drawn point so the tail joins the drawn path
+        tail = self._executed_buffer.points[max(self._baked_points - 1, 0):]
+        self._executed_tail.set_xdata(tail[:, 0])
+        self._executed_tail.set_ydata(tail[:, 1])
+        if self._blit.bake([self._executed_tail]):
+            self._baked_points = n_points
+        self._executed_tail.set_data([], [])
 
-        # Redraw (draw_idle is thread-safe, just schedules a redraw)
-        self.fig.canvas.draw_idle()
+    def _on_draw(self, event):
+        """A full draw renders the whole executed path into the new background."""
+        self._baked_points = len(self._executed_buffer)
 
     def show(self, block=False):
         """
@@ -262,6 +433,11 @@ class LivePlotter:
         Args:
             block: If True, blocks until window is closed
         """
+        if self.headless:
+            return
+
+        import matplotlib.pyplot as plt
+
         plt.show(block=block)
         if not block:
             plt.pause(0.001)  # Allow GUI to update
@@ -270,6 +446,9 @@ class LivePlotter:
         """
         Save the current plot to a file.
 
+        Saved at the figure's own size (no tight bounding box, which would
+        need an extra layout pass).
+
         Args:
             filepath: Path where to save the image
         """
@@ -277,23 +456,134 @@ class LivePlotter:
             filepath,
             facecolor=MONUMENTAL_DARK_BLUE,
             edgecolor='none',
-            bbox_inches='tight',
-            dpi=150
+            dpi=100
         )
 
     def close(self):
-        """Close the plot window."""
+        """Close the plot window and release the plotting state."""
+        # Drop canvas callbacks, the cached background and the path data, so
+        # a closed plotter that is still referenced doesn't hold them alive
+        self._blit.disconnect()
+        self.fig.canvas.mpl_disconnect(self._draw_cid)
+        self._executed_buffer = PointBuffer()
+        self._baked_points = 0
+        self.executed_path = []
+        self.fig.clf()
+
+        if self.headless:
+            return
+
+        import matplotlib.pyplot as plt
+
         plt.close(self.fig)
 
 
-def create_live_plotter(planned_path: List[Tuple[float, float]]) -> LivePlotter:
+def create_live_plotter(
+    planned_path: List[Tuple[float, float]],
+    headless: bool = False
+) -> LivePlotter:
     """
     Convenience function to create a LivePlotter instance.
 
     Args:
         planned_path: List of (x, y) coordinates defining the complete path
+        headless: If True, only render when saving (no display needed)
 
     Returns:
         LivePlotter instance ready for use
     """
-    return LivePlotter(planned_path)
+    return LivePlotter(planned_path, headless=headless)
+
+
+def _render_preview_frames(
+    planned_path: np.ndarray,
+    frames: List[Tuple[int, int]],
+    fps: float,
+    total_time: float
+) -> List[bytes]:
+    """
+    Render a run of preview frames to PNG bytes (runs in a worker process).
+
+    Args:
+        planned_path: Complete path being previewed, shape (N, 2)
+        frames: (frame index, number of points drawn) for each frame
+        fps: Playback frame rate, for the time shown in each frame
+        total_time: Playback duration of the whole animation (seconds)
+
+    Returns:
+        PNG image bytes for each frame
+    """
+    plotter = LivePlotter(planned_path, headless=True)
+    images = []
+    for frame_index, n_drawn in frames:
+        plotter.update_progress(
+            planned_path[:n_drawn],
+            n_drawn - 1,
+            frame_index / fps,
+            total_time
+        )
+        buffer = BytesIO()
+        plotter.save(buffer)  # savefig's default format is PNG
+        images.append(buffer.getvalue())
+    return images
+
+
+def render_preview_animation(
+    planned_path: List[Tuple[float, float]],
+    out_path: Union[str, Path],
+    n_frames: int = 60,
+    fps: float = 15.0,
+    n_jobs: Optional[int] = None
+) -> Path:
+    """
+    Render an animation of the planned path being drawn.
+
+    Frames are independent, so they are split into contiguous runs rendered
+    in parallel, each worker process on its own headless LivePlotter. The
+    output format follows the file extension (e.g. .gif, .webp, .png).
+
+    Args:
+        planned_path: List of (x, y) coordinates defining the complete path
+        out_path: Animation file to write
+        n_frames: Number of frames
+        fps: Playback frame rate
+        n_jobs: Number of worker processes (default: CPU count); 1 renders
+            in this process
+
+    Returns:
+        Path of the written animation
+    """
+    from PIL import Image  # Pillow is a matplotlib dependency
+
+    planned_path = np.asarray(planned_path, dtype=np.float64)
+    if len(planned_path) < 2:
+        raise ValueError("Planned path needs at least 2 points")
+    if n_frames < 1:
+        raise ValueError("n_frames must be at least 1")
+
+    # Points drawn in each frame, from the start point to the complete path
+    drawn = np.linspace(1, len(planned_path), n_frames).round().astype(int)
+    frames = list(enumerate(drawn.tolist()))
+    total_time = (n_frames - 1) / fps
+
+    n_jobs = min(n_jobs or os.cpu_count() or 1, n_frames)
+    run_length = -(-n_frames // n_jobs)  # Ceiling division
+    runs = [frames[i:i + run_length] for i in range(0, n_frames, run_length)]
+    render = partial(_render_preview_frames, planned_path, fps=fps, total_time=total_time)
+
+    if len(runs) == 1:
+        rendered = [render(runs[0])]
+    else:
+        with ProcessPoolExecutor(max_workers=len(runs)) as executor:
+            rendered = list(executor.map(render, runs))
+
+    images = [Image.open(BytesIO(png)) for run in rendered for png in run]
+    out_path = Path(out_path)
+    images[0].save(
+        out_path,
+        save_all=True,
+        append_images=images[1:],
+        duration=round(1000 / fps),
+        loop=0
+    )
+    return out_path
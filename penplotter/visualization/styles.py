@@ -3,7 +3,6 @@ Monumental-branded color scheme and styling utilities for matplotlib visualizati
 """
 
 from matplotlib.colors import LinearSegmentedColormap
-import matplotlib.pyplot as plt
 
 # Monumental Brand Colors
 MONUMENTAL_ORANGE = "#f74823"
@@ -105,6 +104,8 @@ def create_dark_figure(figsize=(12, 8), nrows=1, ncols=1):
     Returns:
         fig, ax (or axes array if nrows*ncols > 1)
     """
+    import matplotlib.pyplot as plt
+
     fig, axes = plt.subplots(
         nrows=nrows,
         ncols=ncols,
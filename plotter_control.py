@@ -1,20 +1,23 @@
 #!/usr/bin/env python3
 """Direct plotter control CLI for manual positioning and testing."""
 
+import logging
 import sys
+
+from penplotter import config
 from penplotter.hardware import Plotter
-from penplotter.kinematics import polar_to_hardware, hardware_to_polar
+from penplotter.kinematics import hardware_to_polar, polar_to_hardware
 
 
 def print_help():
     """Print available commands."""
     print("\nAvailable commands:")
     print("  home                    - Move to home position")
-    print("  rotate <degrees>        - Rotate to angle (requires GET_POS)")
-    print("  linear <mm>             - Extend to distance (requires GET_POS)")
+    print("  rotate <degrees>        - Rotate to angle (keeps current radius)")
+    print("  linear <mm>             - Extend to distance (keeps current angle)")
     print("  raw_rotate <steps>      - Rotate to absolute microsteps (direct)")
     print("  raw_linear <adc>        - Extend to ADC value 0-834 (direct)")
-    print("  pos                     - Get current position")
+    print("  pos                     - Get current position (queries the plotter)")
     print("  stop                    - Emergency stop")
     print("  debug                   - Toggle debug mode")
     print("  help                    - Show this help")
@@ -35,6 +38,11 @@ def main(port: str):
         plotter.connect()
         print("Connected! Type 'help' for available commands.\n")
 
+        # Last known (steps, adc), so rotate/linear can keep the other axis
+        # without a GET_POS round-trip. None when unknown (after a stop or an
+        # error); it is then queried again.
+        last_pos = None
+
         while True:
             try:
                 # Get user input
@@ -56,6 +64,7 @@ def main(port: str):
                 elif command == "home":
                     print("Homing...")
                     plotter.home()
+                    last_pos = polar_to_hardware(config.HOME_ANGLE_DEG, config.HOME_RADIUS_MM)
                     print("Done")
 
                 elif command == "rotate":
@@ -64,11 +73,14 @@ def main(port: str):
                         continue
                     degrees = float(parts[1])
                     # Convert to hardware units (keep current radius)
-                    current_steps, current_adc = plotter.get_pos()
+                    if last_pos is None:
+                        last_pos = plotter.get_pos()
+                    current_steps, current_adc = last_pos
                     current_angle, current_radius = hardware_to_polar(current_steps, current_adc)
                     steps, _ = polar_to_hardware(degrees, current_radius)
                     print(f"Rotating to {degrees}° ({steps} steps)...")
                     plotter.rotate(steps)
+                    last_pos = (steps, current_adc)
                     print("Done")
 
                 elif command == "linear":
@@ -77,21 +89,26 @@ def main(port: str):
                         continue
                     mm = float(parts[1])
                     # Convert to hardware units (keep current angle)
-                    current_steps, current_adc = plotter.get_pos()
+                    if last_pos is None:
+                        last_pos = plotter.get_pos()
+                    current_steps, current_adc = last_pos
                     current_angle, current_radius = hardware_to_polar(current_steps, current_adc)
                     _, adc = polar_to_hardware(current_angle, mm)
                     print(f"Extending to {mm}mm (ADC {adc})...")
                     plotter.linear(adc)
+                    last_pos = (current_steps, adc)
                     print("Done")
 
                 elif command == "pos":
                     steps, adc = plotter.get_pos()
+                    last_pos = (steps, adc)
                     angle, radius = hardware_to_polar(steps, adc)
                     print(f"Position: {angle:.1f}° ({steps} steps), {radius:.1f}mm (ADC {adc})")
 
                 elif command == "stop":
                     print("Emergency stop!")
                     plotter.stop()
+                    last_pos = None  # Stopped mid-move
                     print("Stopped")
 
                 elif command == "raw_rotate":
@@ -101,6 +118,8 @@ def main(port: str):
                     steps = int(parts[1])
                     print(f"Rotating to {steps} steps...")
                     plotter.rotate(steps)
+                    if last_pos is not None:
+                        last_pos = (steps, last_pos[1])
                     print("Done")
 
                 elif command == "raw_linear":
@@ -113,10 +132,17 @@ def main(port: str):
                         continue
                     print(f"Extending to ADC {adc}...")
                     plotter.linear(adc)
+                    if last_pos is not None:
+                        last_pos = (last_pos[0], adc)
                     print("Done")
 
                 elif command == "debug":
                     plotter.debug = not plotter.debug
+                    # The plotter only produces the traffic records; showing
+                    # them is this CLI's logging configuration
+                    logging.getLogger("penplotter.hardware").setLevel(
+                        logging.DEBUG if plotter.debug else logging.INFO
+                    )
                     print(f"Debug mode: {'ON' if plotter.debug else 'OFF'}")
 
                 else:
@@ -124,9 +150,11 @@ def main(port: str):
                     print("Type 'help' for available commands")
 
             except KeyboardInterrupt:
+                last_pos = None  # A move may have been cut short
                 print("\n\nInterrupted. Type 'quit' to exit.")
 
             except Exception as e:
+                last_pos = None
                 print(f"Error: {e}")
 
         print("\nDisconnecting...")
@@ -144,5 +172,8 @@ if __name__ == "__main__":
         print("Example: python plotter_control.py /dev/ttyACM0")
         sys.exit(1)
 
+    # Library status messages are logged - show them like the CLI's own output
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
     port = sys.argv[1]
     main(port)
@@ -0,0 +1,78 @@
+"""Tests for the vectorized Bezier flattener used by the curve drawers."""
+
+import numpy as np
+import pytest
+
+from penplotter import config
+from penplotter.control.curves import _flatten_cubics, _is_flat, _split_half
+from penplotter.path.bezier import generate_bezier_curve
+
+CURVES = [
+    [(0.0, 200.0), (25.0, 300.0), (75.0, 150.0), (100.0, 250.0)],
+    [(-100.0, 300.0), (-100.0, 450.0), (100.0, 450.0), (100.0, 300.0)],
+    [(0.0, 200.0), (10.0, 210.0), (20.0, 220.0), (30.0, 230.0)],
+]
+
+
+def _distance_to_polyline(points, polyline):
+    """Distance from each point to the nearest segment of a polyline."""
+    starts, ends = polyline[:-1], polyline[1:]
+    chords = ends - starts
+    offsets = points[:, None, :] - starts[None, :, :]
+    lengths_sq = np.maximum((chords * chords).sum(axis=1), 1e-12)
+    t = np.clip((offsets * chords).sum(axis=2) / lengths_sq, 0.0, 1.0)
+    nearest = offsets - t[:, :, None] * chords
+    return np.hypot(nearest[..., 0], nearest[..., 1]).min(axis=1)
+
+
+@pytest.mark.parametrize("control_polygon", CURVES)
+def test_flattened_curve_stays_within_tolerance(control_polygon):
+    tolerance = config.CURVE_TOLERANCE_MM
+    p0, p1, p2, p3 = control_polygon
+
+    chord_ends = _flatten_cubics(np.array([control_polygon]), tolerance)
+    polyline = np.vstack((p0, chord_ends))
+    samples = generate_bezier_curve(p0, p3, [p1, p2], num_samples=500)
+
+    assert _distance_to_polyline(samples, polyline).max() <= tolerance
+
+
+def test_flatten_keeps_end_points_of_every_curve():
+    # Two curves chained end to end: the shared point is kept exactly
+    chain = np.array([CURVES[0], [CURVES[0][3], (120.0, 300.0), (140.0, 200.0), (130.0, 350.0)]])
+
+    chord_ends = _flatten_cubics(chain, config.CURVE_TOLERANCE_MM)
+
+    assert tuple(chord_ends[-1]) == (130.0, 350.0)
+    assert (chord_ends == chain[0, 3]).all(axis=1).any()
+
+
+def test_straight_curve_flattens_to_a_single_chord():
+    chord_ends = _flatten_cubics(np.array([CURVES[2]]), config.CURVE_TOLERANCE_MM)
+
+    np.testing.assert_array_equal(chord_ends, [(30.0, 230.0)])
+
+
+def test_is_flat_uses_control_point_distance_from_chord():
+    tolerance = config.CURVE_TOLERANCE_MM
+    just_inside = [(0.0, 200.0), (10.0, 200.0 + 0.9 * tolerance), (20.0, 200.0), (30.0, 200.0)]
+    just_outside = [(0.0, 200.0), (10.0, 200.0 + 1.1 * tolerance), (20.0, 200.0), (30.0, 200.0)]
+    # Closed piece: falls back to the distance from p0
+    closed = [(0.0, 200.0), (0.0, 200.0 + 2 * tolerance), (0.0, 200.0), (0.0, 200.0)]
+
+    flat = _is_flat(np.array([just_inside, just_outside, closed]), tolerance)
+
+    assert flat.tolist() == [True, False, False]
+
+
+def test_split_half_meets_at_the_curve_midpoint():
+    curve = np.array([CURVES[0]])
+    p0, p1, p2, p3 = CURVES[0]
+
+    left, right = _split_half(curve)
+
+    midpoint = generate_bezier_curve(p0, p3, [p1, p2], num_samples=3)[1]
+    np.testing.assert_allclose(left[0, 3], midpoint)
+    np.testing.assert_array_equal(left[0, 3], right[0, 0])
+    np.testing.assert_array_equal(left[0, 0], p0)
+    np.testing.assert_array_equal(right[0, 3], p3)
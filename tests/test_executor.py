@@ -0,0 +1,31 @@
+"""Tests for PathExecutor segment bookkeeping."""
+
+import dataclasses
+
+import pytest
+
+from penplotter.control.executor import PathExecutor
+
+
+def test_segments_are_read_only_snapshots():
+    executor = PathExecutor(plotter=None, step_size=5.0)
+    executor.set_path([(0.0, 200.0), (30.0, 200.0), (30.0, 240.0)])
+
+    segments = executor.segments
+
+    assert isinstance(segments, tuple)
+    assert [(s.start, s.end, s.length) for s in segments] == [
+        ((0.0, 200.0), (30.0, 200.0), 30.0),
+        ((30.0, 200.0), (30.0, 240.0), 40.0),
+    ]
+
+    # Changes can't be made through the views, so none are silently lost
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        segments[0].completed = True
+    with pytest.raises(AttributeError):
+        segments.append(segments[0])
+    with pytest.raises(AttributeError):
+        executor.segments = []
+
+    assert executor.completed_segments == 0
+    assert not executor[0].completed
@@ -0,0 +1,40 @@
+"""Tests for Cartesian line and path interpolation."""
+
+import numpy as np
+
+from penplotter.path.interpolation import interpolate_line, interpolate_path
+
+WAYPOINTS = [(0.0, 200.0), (30.0, 200.0), (30.0, 201.0), (-20.0, 250.0), (-20.0, 250.0)]
+
+
+def test_interpolate_line_steps_are_at_most_step_size():
+    points = interpolate_line((0.0, 200.0), (30.0, 240.0), step_size=4.0)
+
+    steps = np.hypot(*np.diff(points, axis=0).T)
+    assert len(points) == 14  # 50mm in ceil(50 / 4) = 13 equal steps
+    np.testing.assert_allclose(steps, 50.0 / 13)
+    np.testing.assert_array_equal(points[0], (0.0, 200.0))
+    np.testing.assert_array_equal(points[-1], (30.0, 240.0))
+
+
+def test_short_line_is_a_single_move():
+    points = interpolate_line((0.0, 200.0), (0.5, 200.0), step_size=5.0)
+
+    np.testing.assert_array_equal(points, [(0.0, 200.0), (0.5, 200.0)])
+
+
+def test_interpolate_path_matches_joined_lines():
+    points = interpolate_path(WAYPOINTS, step_size=5.0)
+
+    # Each segment as interpolate_line would draw it, without the duplicated
+    # point where one segment ends and the next begins
+    lines = [interpolate_line(a, b, 5.0) for a, b in zip(WAYPOINTS[:-1], WAYPOINTS[1:])]
+    expected = np.vstack([lines[0]] + [line[1:] for line in lines[1:]])
+    np.testing.assert_allclose(points, expected, atol=1e-12)
+    np.testing.assert_array_equal(points[-1], WAYPOINTS[-1])
+
+
+def test_interpolate_path_of_single_point():
+    points = interpolate_path([(10.0, 300.0)], step_size=5.0)
+
+    np.testing.assert_array_equal(points, [(10.0, 300.0)])
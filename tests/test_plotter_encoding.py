@@ -0,0 +1,75 @@
+"""Tests for encoding moves into firmware commands."""
+
+import re
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from penplotter.hardware.plotter import _BINARY_OPCODES, encode_binary_frame, encode_moves
+
+FIRMWARE = Path(__file__).resolve().parents[1] / "firmware" / "pen_plotter" / "pen_plotter.ino"
+
+
+def _firmware_constant(name):
+    """Read a constexpr value from the firmware source."""
+    match = re.search(rf"constexpr \w+ {name} = (\w+);", FIRMWARE.read_text())
+    return int(match.group(1), 0)
+
+
+def _decode_like_firmware(frame):
+    """Mirror processBinaryCommand(): checksum, then opcode and int32 argument."""
+    assert len(frame) == _firmware_constant("BINARY_FRAME_SIZE")
+    checksum = 0
+    for byte in frame[:-1]:
+        checksum ^= byte
+    assert checksum == frame[-1], "checksum mismatch"
+    arg = frame[1] | frame[2] << 8 | frame[3] << 16 | frame[4] << 24
+    if arg >= 1 << 31:
+        arg -= 1 << 32
+    return frame[0], arg
+
+
+def test_encode_moves_interleaves_rotate_and_linear():
+    commands, move_indices = encode_moves([(100, 200), (-50, 300)])
+
+    assert commands == ["ROTATE 100", "LINEAR 200", "ROTATE -50", "LINEAR 300"]
+    assert move_indices.tolist() == [0, 0, 1, 1]
+
+
+def test_encode_moves_skips_only_consecutive_repeats():
+    moves = np.array([(10, 20), (10, 20), (10, 30), (15, 30), (10, 20)])
+
+    commands, move_indices = encode_moves(moves)
+
+    # The last move returns to the first target, so it is sent again in full
+    assert commands == [
+        "ROTATE 10", "LINEAR 20",
+        "LINEAR 30",
+        "ROTATE 15",
+        "ROTATE 10", "LINEAR 20",
+    ]
+    assert move_indices.tolist() == [0, 0, 2, 3, 4, 4]
+
+
+def test_encode_moves_of_no_moves_is_empty():
+    commands, move_indices = encode_moves(np.empty((0, 2), dtype=np.int64))
+
+    assert commands == []
+    assert len(move_indices) == 0
+
+
+def test_binary_opcodes_match_firmware():
+    assert _BINARY_OPCODES["ROTATE"] == _firmware_constant("OPCODE_ROTATE")
+    assert _BINARY_OPCODES["LINEAR"] == _firmware_constant("OPCODE_LINEAR")
+    # The firmware tells binary frames from text commands by the high bit
+    assert all(opcode & 0x80 for opcode in _BINARY_OPCODES.values())
+
+
+@pytest.mark.parametrize("arg", [0, 1, 834, -1, -12800, 2**31 - 1, -(2**31)])
+def test_binary_frame_decodes_like_firmware(arg):
+    opcode = _BINARY_OPCODES["ROTATE"]
+
+    frame = encode_binary_frame(opcode, arg)
+
+    assert _decode_like_firmware(frame) == (opcode, arg)
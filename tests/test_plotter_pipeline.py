@@ -0,0 +1,182 @@
+"""Tests for pipelined command streaming and recovery after a failed command."""
+
+import threading
+import time
+from collections import deque
+
+import pytest
+
+from penplotter.hardware.plotter import Plotter, PlotterError, PlotterTimeoutError
+
+
+class FakeFirmware:
+    """Serial port stand-in that executes commands one at a time, like the firmware.
+
+    Written commands are queued and only executed when the host reads, so a
+    response is never available before the host has waited for the previous
+    ones - queued commands keep running after the host stops reading.
+
+    Args:
+        errors: Commands answered with ERROR
+        delays: Seconds a command takes before its OK arrives
+    """
+
+    def __init__(self, errors=(), delays=None):
+        self.errors = set(errors)
+        self.delays = delays or {}
+        self.executed = []
+        self.is_open = True
+        self._queued = deque()
+        self._output = deque()
+        self._busy_until = None
+        self._buffer = b""
+        self._lock = threading.Lock()
+
+    def write(self, data):
+        with self._lock:
+            self._buffer += data
+            while b"\n" in self._buffer:
+                line, self._buffer = self._buffer.split(b"\n", 1)
+                self._queued.append(line.decode())
+        return len(data)
+
+    @property
+    def in_waiting(self):
+        with self._lock:
+            return sum(len(line) for line in self._output)
+
+    def readline(self):
+        with self._lock:
+            if not self._output:
+                self._execute_next()
+            if self._output:
+                return self._output.popleft()
+        time.sleep(0.005)  # Real readline() blocks until the port timeout
+        return b""
+
+    def _execute_next(self):
+        if self._busy_until is not None:
+            if time.monotonic() < self._busy_until:
+                return
+            self._busy_until = None
+            self._output.append(b"OK\n")
+            return
+        if not self._queued:
+            return
+
+        command = self._queued.popleft()
+        self.executed.append(command)
+        if command in self.errors:
+            self._output.append(b"ERROR bad command\n")
+        elif command in self.delays:
+            self._busy_until = time.monotonic() + self.delays[command]
+        elif command == "GET_POS":
+            self._output.append(b"OK 100 200\n")
+        else:
+            self._output.append(b"OK\n")
+
+    def pending(self):
+        """Commands not yet executed plus responses not yet read."""
+        with self._lock:
+            return len(self._queued) + len(self._output) + (self._busy_until is not None)
+
+    def close(self):
+        self.is_open = False
+
+
+def make_plotter(firmware):
+    """Plotter wired to a fake port, skipping connect()'s port setup and wait."""
+    plotter = Plotter("fake")
+    plotter.serial = firmware
+    plotter._connected = True
+    plotter._start_writer()
+    return plotter
+
+
+COMMANDS = [f"ROTATE {i}" for i in range(8)]
+
+
+def test_send_commands_returns_responses_in_order():
+    firmware = FakeFirmware()
+    plotter = make_plotter(firmware)
+    acknowledged = []
+
+    responses = plotter.send_commands(COMMANDS, timeout=1.0, callback=acknowledged.append)
+
+    assert responses == ["OK"] * len(COMMANDS)
+    assert acknowledged == list(range(len(COMMANDS)))
+    assert firmware.executed == COMMANDS
+    plotter.disconnect()
+
+
+def test_error_mid_window_stops_and_resyncs():
+    firmware = FakeFirmware(errors={"ROTATE 1"})
+    plotter = make_plotter(firmware)
+
+    with pytest.raises(PlotterError, match="ROTATE 1"):
+        plotter.send_commands(COMMANDS, timeout=1.0)
+
+    # STOP follows the commands already in flight (the window was topped up to
+    # ROTATE 4 when ROTATE 0 was acknowledged); nothing after it is sent
+    assert firmware.executed == COMMANDS[:5] + ["STOP"]
+    assert firmware.pending() == 0
+
+    # The next exchanges get their own responses, not stale OKs
+    assert plotter.get_pos() == (100, 200)
+    plotter.stop()
+    assert firmware.executed[-1] == "STOP"
+    assert firmware.pending() == 0
+    plotter.disconnect()
+
+
+def test_timeout_mid_window_stops_and_resyncs():
+    firmware = FakeFirmware(delays={"ROTATE 1": 0.3})
+    plotter = make_plotter(firmware)
+
+    with pytest.raises(PlotterTimeoutError, match="ROTATE 1"):
+        plotter.send_commands(COMMANDS, timeout=0.2)
+
+    # The late OK of the timed-out command is consumed along with the rest
+    assert firmware.executed[-1] == "STOP"
+    assert firmware.pending() == 0
+    assert plotter.get_pos() == (100, 200)
+    plotter.disconnect()
+
+
+def test_move_batch_error_stops_and_resyncs():
+    firmware = FakeFirmware(errors={"LINEAR 11"})
+    plotter = make_plotter(firmware)
+    reported = []
+
+    moves = [(i, 10 + i) for i in range(6)]
+    with pytest.raises(PlotterError, match="LINEAR 11"):
+        plotter.move_batch(moves, reported.append, timeout=1.0)
+
+    assert reported == [0]
+    assert firmware.executed[-1] == "STOP"
+    assert firmware.pending() == 0
+    assert plotter.get_pos() == (100, 200)
+    plotter.disconnect()
+
+
+class FailingWriteFirmware(FakeFirmware):
+    """Fake port whose writes fail with an error that is not a SerialException."""
+
+    def write(self, data):
+        raise OSError("device disconnected")
+
+
+def test_failed_write_is_raised_by_flush_and_next_write():
+    plotter = make_plotter(FailingWriteFirmware())
+
+    plotter._write("ROTATE 0")
+    with pytest.raises(PlotterError, match="device disconnected"):
+        plotter.flush()
+
+    # The writer thread survives the error and reports the next failure too
+    assert plotter._writer.is_alive()
+    plotter._write("ROTATE 1")
+    plotter._write_queue.join()
+    with pytest.raises(PlotterError, match="device disconnected"):
+        plotter._write("ROTATE 2")
+    plotter.disconnect()
@@ -0,0 +1,59 @@
+"""Tests for the growable point buffer behind the GUI's line data."""
+
+import numpy as np
+
+from penplotter.visualization.buffer import PointBuffer
+
+
+def _block(start, count):
+    """(count, 2) block of distinct points, numbered from start."""
+    index = np.arange(start, start + count, dtype=np.float64)
+    return np.column_stack((index, index * 10.0))
+
+
+def test_append_grows_capacity_and_keeps_points():
+    buffer = PointBuffer(capacity=4)
+
+    buffer.append(_block(0, 3))
+    buffer.append(_block(3, 3))  # Past capacity: doubles to 8
+    buffer.append(_block(6, 10))  # Beyond double: grows to fit
+
+    assert len(buffer) == 16
+    np.testing.assert_array_equal(buffer.points, _block(0, 16))
+
+
+def test_pop_truncates_the_last_block_only():
+    buffer = PointBuffer(capacity=4)
+    buffer.append(_block(0, 3))
+    buffer.append(_block(3, 5))
+
+    buffer.pop()
+
+    np.testing.assert_array_equal(buffer.points, _block(0, 3))
+
+    # The next block overwrites the popped one in place
+    buffer.append(_block(100, 2))
+    np.testing.assert_array_equal(buffer.points, np.vstack((_block(0, 3), _block(100, 2))))
+
+
+def test_clear_empties_but_keeps_capacity():
+    buffer = PointBuffer(capacity=4)
+    buffer.append(_block(0, 10))
+    data = buffer._data
+
+    buffer.clear()
+
+    assert len(buffer) == 0
+    assert buffer.points.shape == (0, 2)
+    buffer.append(_block(0, 10))
+    assert buffer._data is data
+
+
+def test_empty_blocks_count_as_blocks():
+    buffer = PointBuffer()
+    buffer.append(_block(0, 2))
+    buffer.append(np.empty((0, 2)))
+
+    buffer.pop()
+
+    assert len(buffer) == 2
@@ -0,0 +1,39 @@
+"""Tests for Ramer-Douglas-Peucker polyline simplification."""
+
+import numpy as np
+
+from penplotter.path.simplify import simplify_polyline
+
+
+def test_collinear_run_collapses_to_end_points():
+    points = [(0.0, 200.0), (10.0, 200.0), (20.0, 200.0), (30.0, 200.0), (40.0, 200.0)]
+
+    simplified = simplify_polyline(points, tolerance=0.1)
+
+    np.testing.assert_array_equal(simplified, [(0.0, 200.0), (40.0, 200.0)])
+
+
+def test_retrace_keeps_turning_point():
+    # The turning point lies on the line through the end points but far
+    # outside the segment between them
+    points = [(0.0, 200.0), (50.0, 200.0), (-50.0, 200.0)]
+
+    simplified = simplify_polyline(points, tolerance=0.1)
+
+    np.testing.assert_array_equal(simplified, points)
+
+
+def test_closed_loop_keeps_its_corners():
+    square = [(0.0, 200.0), (20.0, 200.0), (20.0, 220.0), (0.0, 220.0), (0.0, 200.0)]
+
+    simplified = simplify_polyline(square, tolerance=0.1)
+
+    np.testing.assert_array_equal(simplified, square)
+
+
+def test_small_deviations_within_tolerance_are_dropped():
+    points = [(0.0, 200.0), (10.0, 200.05), (20.0, 199.95), (30.0, 200.0)]
+
+    simplified = simplify_polyline(points, tolerance=0.1)
+
+    np.testing.assert_array_equal(simplified, [(0.0, 200.0), (30.0, 200.0)])
@@ -0,0 +1,49 @@
+"""Tests for the batch kinematics against the scalar reference."""
+
+import numpy as np
+
+from penplotter import config
+from penplotter.kinematics import (
+    cartesian_to_hardware,
+    cartesian_to_hardware_batch,
+    cartesian_to_moves,
+)
+
+
+def _workspace_grid(step=2.5):
+    xs = np.arange(config.WORKSPACE_X_MIN, config.WORKSPACE_X_MAX + step, step)
+    ys = np.arange(config.WORKSPACE_Y_MIN, config.WORKSPACE_Y_MAX + step, step)
+    grid_x, grid_y = np.meshgrid(xs, ys)
+    return grid_x.ravel(), grid_y.ravel()
+
+
+def test_batch_matches_scalar_over_workspace_grid():
+    xs, ys = _workspace_grid()
+
+    microsteps, adc_values = cartesian_to_hardware_batch(xs, ys)
+
+    expected = np.array([cartesian_to_hardware(x, y) for x, y in zip(xs.tolist(), ys.tolist())])
+    np.testing.assert_array_equal(microsteps, expected[:, 0])
+    np.testing.assert_array_equal(adc_values, expected[:, 1])
+
+
+def test_batch_clamps_adc_like_scalar():
+    # Inside the pen offset and far beyond the actuator's reach
+    xs = np.array([0.0, 0.0, 300.0])
+    ys = np.array([10.0, 2000.0, 300.0])
+
+    _, adc_values = cartesian_to_hardware_batch(xs, ys)
+
+    expected = [cartesian_to_hardware(x, y)[1] for x, y in zip(xs.tolist(), ys.tolist())]
+    assert adc_values.tolist() == expected
+    assert adc_values.min() >= config.ADC_MIN and adc_values.max() <= config.ADC_MAX
+
+
+def test_cartesian_to_moves_columns_match_batch():
+    xs, ys = _workspace_grid(step=10.0)
+
+    moves = cartesian_to_moves(np.column_stack((xs, ys)))
+
+    microsteps, adc_values = cartesian_to_hardware_batch(xs, ys)
+    assert moves.dtype == np.int64
+    np.testing.assert_array_equal(moves, np.column_stack((microsteps, adc_values)))